@@ -0,0 +1,5 @@
+"""
+Subcommands of the Codantix CLI.
+
+Each command lives in its own module, imported by :mod:`codantix.cli` only when the command is used.
+"""
@@ -0,0 +1,388 @@
+"""
+Shared building blocks of the Codantix documentation commands.
+
+This module provides the helpers used by `init`, `update-db`, `doc-pr` and `serve` to set up the
+generator and vector database, select changed files and elements, generate documentation in
+concurrent batches and build vector DB entries.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+
+import click
+from tqdm import tqdm
+
+from codantix.config import Config
+from codantix.hash_store import content_hash, element_key, file_hash
+from codantix.server import forward
+
+# Modules depending on LangChain (doc_generator, embedding) or on the language
+# parsers (documentation) are imported inside the functions that use them, so
+# listing commands and forwarding them to `codantix serve` stay fast.
+
+
+# Number of documents written to the vector database per batch
+FLUSH_SIZE = 256
+
+
+# Batches pending at once per allowed concurrent LLM request, so that a request
+# slot freed while earlier results are consumed is refilled right away
+PENDING_BATCHES_PER_REQUEST = 2
+
+
+# Content hashes of indexed elements, relative to the repository root
+HASHES_PATH = Path(".codantix") / "hashes.json"
+
+# SHA-256 hashes of indexed source files, relative to the repository root
+FILE_HASHES_PATH = Path(".codantix") / "file_hashes.json"
+
+# Code elements parsed from source files, relative to the repository root
+PARSE_CACHE_PATH = Path(".codantix") / "parse_cache.pkl"
+
+# Cached LLM answers, relative to the repository root
+LLM_CACHE_PATH = Path(".codantix") / "llm_cache.sqlite"
+
+# Cached embedding vectors, relative to the repository root
+EMBEDDING_CACHE_PATH = Path(".codantix") / "embedding_cache.sqlite"
+
+# Generators and embedding managers built in this process, reused by later
+# commands when running under `codantix serve`
+_instances = {}
+
+# Metadata keys stored with each indexed element, and how to read them
+_META_FIELDS = (
+    ("file_path", lambda e: str(e.file_path)),
+    ("element", lambda e: e.name),
+    ("type", lambda e: e.type.value),
+    ("line", lambda e: e.line_number),
+    ("parent", lambda e: e.parent),
+)
+
+
+def build_metadata(element, version, digest=None):
+    """Build the vector DB metadata for a code element.
+
+    Only scalar values are kept, since vector stores reject nested or null metadata.
+    """
+    metadata = {}
+    for key, accessor in _META_FIELDS:
+        value = accessor(element)
+        if value is not None and isinstance(value, (str, int, float, bool)):
+            metadata[key] = value
+    if version is not None:
+        metadata["version"] = version
+    if digest is not None:
+        metadata["content_hash"] = digest
+    return metadata
+
+
+def element_store_key(element):
+    """Key identifying a code element in the hash store."""
+    return element_key(
+        str(element.file_path), element.type.value, element.name, element.parent
+    )
+
+
+def doc_id(element, version):
+    """Vector DB id of a code element's entry, stable across runs for a version."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{element_store_key(element)}::{version}"))
+
+
+def element_hash(element, salt):
+    """Content hash of a code element, as recorded in the hash store."""
+    source = element.source or element.docstring or element.name
+    return content_hash(f"{salt}\0{source}")
+
+
+def changed_elements(elements, hashes, emb_mgr, salt, force=False):
+    """Select the elements whose content changed since they were last indexed.
+
+    Hashes come from the local hash store; files it has no record of are
+    looked up once in the vector DB metadata.
+
+    Args:
+        elements (iterable): Code elements found in the source tree.
+        hashes (HashStore): Hashes recorded by previous runs.
+        emb_mgr (EmbeddingManager): Manager used to query indexed metadata.
+        salt (str): Mixed into each hash so that a change of mode, style or
+            version re-indexes unchanged code.
+        force (bool): Select every element regardless of stored hashes.
+
+    Yields:
+        tuple: ``(element, digest)`` pairs for new or changed elements.
+    """
+    looked_up = set()
+    for element in elements:
+        file_path = str(element.file_path)
+        key = element_store_key(element)
+        if not force and hashes.get(key) is None and file_path not in looked_up:
+            looked_up.add(file_path)
+            for metadata in emb_mgr.get_metadatas(file_path):
+                if "content_hash" in metadata and "element" in metadata:
+                    hashes.set(
+                        element_key(
+                            file_path,
+                            metadata.get("type", ""),
+                            metadata["element"],
+                            metadata.get("parent"),
+                        ),
+                        metadata["content_hash"],
+                    )
+        digest = element_hash(element, salt)
+        if force or hashes.get(key) != digest:
+            yield element, digest
+
+
+@lru_cache(maxsize=8)
+def _parse_readme(readme_path, mtime_ns):
+    """Parse a README, cached on its path and modification time."""
+    from codantix.documentation import ReadmeParser
+
+    return ReadmeParser().parse(readme_path)
+
+
+def _project_context(repo_path):
+    """Build the project context from the repository README.
+
+    Args:
+        repo_path (Path): Repository root.
+
+    Returns:
+        dict: README context plus the project ``name``.
+    """
+    readme_path = repo_path / "README.md"
+    try:
+        mtime_ns = readme_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    context = dict(_parse_readme(readme_path, mtime_ns))
+    context["name"] = repo_path.name
+    return context
+
+
+def _cached(key, factory):
+    """Return the object built by ``factory`` for ``key``, building it once per process."""
+    if key not in _instances:
+        _instances[key] = factory()
+    return _instances[key]
+
+
+def forwarded(name, **params):
+    """Run a command in the `codantix serve` process, if one is listening.
+
+    Args:
+        name (str): The command name.
+        **params: The command's parameter values.
+
+    Returns:
+        bool: True if the server ran the command, False if it should run locally.
+
+    Raises:
+        SystemExit: If the command failed in the server.
+    """
+    response = forward(name, params)
+    if response is None:
+        return False
+    click.echo(response["stdout"], nl=False)
+    click.echo(response["stderr"], nl=False, err=True)
+    if response["exit_code"]:
+        sys.exit(response["exit_code"])
+    return True
+
+
+def setup(config=None):
+    """Build the objects shared by the documentation commands.
+
+    Args:
+        config (str, optional): Path to the configuration file.
+
+    Returns:
+        tuple: ``(config_obj, repo_path, generator, context, traverser)``.
+    """
+    from codantix.doc_generator import DocumentationGenerator
+    from codantix.documentation import CodebaseTraverser
+    from codantix.llm_cache import LLMCache
+
+    config_obj = Config.load(config)
+    repo_path = Path(os.getcwd())
+    generator = _cached(
+        ("generator", config_obj.doc_style, config_obj.llm.model_dump_json()),
+        lambda: DocumentationGenerator(
+            doc_style=config_obj.doc_style,
+            llm_config=config_obj.llm,
+            cache=LLMCache(LLM_CACHE_PATH),
+            semantic_cache=semantic_cache(config_obj),
+        ),
+    )
+    context = _project_context(repo_path)
+    traverser = CodebaseTraverser(
+        config_obj.languages, cache_path=repo_path / PARSE_CACHE_PATH
+    )
+    return config_obj, repo_path, generator, context, traverser
+
+
+def changed_files(files, file_hashes, salt, force=False):
+    """Select the source files whose content changed since they were last indexed.
+
+    The new hashes of the selected files are recorded in ``file_hashes``.
+
+    Args:
+        files (list): Source files found in the source tree.
+        file_hashes (HashStore): File hashes recorded by previous runs.
+        salt (str): Mixed into each hash; see :func:`changed_elements`.
+        force (bool): Select every file regardless of stored hashes.
+
+    Returns:
+        list: The new or changed files.
+    """
+    changed = []
+    for file_path in files:
+        digest = file_hash(file_path, salt)
+        if force or file_hashes.get(str(file_path)) != digest:
+            file_hashes.set(str(file_path), digest)
+            changed.append(file_path)
+    return changed
+
+
+def remove_deleted_files(file_hashes, hashes, emb_mgr):
+    """Remove the index entries of previously indexed files that no longer exist.
+
+    Args:
+        file_hashes (HashStore): File hashes recorded by previous runs.
+        hashes (HashStore): Element hashes recorded by previous runs.
+        emb_mgr (EmbeddingManager): Manager whose vector DB entries are removed.
+    """
+    deleted = {
+        file_path for file_path in file_hashes.keys() if not os.path.exists(file_path)
+    }
+    if not deleted:
+        return
+    db_delete = getattr(emb_mgr.db, "delete", None)
+    if db_delete is not None:
+        db_delete(where={"file_path": {"$in": sorted(deleted)}})
+    forget_files(deleted, file_hashes, hashes)
+
+
+def forget_files(file_paths, file_hashes, hashes):
+    """Drop the recorded file and element hashes of files removed from the index.
+
+    A file restored later with the same content is then indexed again.
+
+    Args:
+        file_paths (set): Paths of the removed files, as recorded in the stores.
+        file_hashes (HashStore): File hashes recorded by previous runs.
+        hashes (HashStore): Element hashes recorded by previous runs.
+    """
+    for file_path in file_paths:
+        file_hashes.remove(file_path)
+    for key in hashes.keys():
+        if key.split("::", 1)[0] in file_paths:
+            hashes.remove(key)
+
+
+def embedding_manager(config_obj):
+    """Create the EmbeddingManager described by the vector DB configuration."""
+    from codantix.embedding import EmbeddingManager
+
+    return _cached(
+        ("embedding", os.getcwd(), config_obj.vector_db.model_dump_json()),
+        lambda: EmbeddingManager(
+            config_obj.vector_db.embedding,
+            config_obj.vector_db.provider,
+            config_obj.vector_db.type,
+            config_obj.vector_db.dimensions,
+            config_obj.vector_db.collection_name,
+            config_obj.vector_db.host,
+            config_obj.vector_db.port,
+            config_obj.vector_db.persist_directory,
+            config_obj.vector_db.batch_size,
+            config_obj.vector_db.max_concurrency,
+            config_obj.vector_db.async_embeddings,
+            EMBEDDING_CACHE_PATH,
+            config_obj.vector_db.quantize,
+        ),
+    )
+
+
+def semantic_cache(config_obj):
+    """Create the semantic LLM answer cache, or return None if it is disabled.
+
+    Prompts are embedded with the embedding model of the vector DB configuration.
+    """
+    if not config_obj.llm.enable_semantic_cache:
+        return None
+    from codantix.llm_cache import SemanticCache
+
+    return SemanticCache(
+        LLM_CACHE_PATH,
+        embedding_manager(config_obj).embeddings,
+        threshold=config_obj.llm.semantic_threshold,
+    )
+
+
+def generate_docs(generator, items, context, max_concurrency, batch_size, desc):
+    """Generate documentation for elements concurrently, in batches.
+
+    Items are grouped into batches of ``batch_size`` so that each LLM call
+    documents several elements, and up to ``max_concurrency`` batches are in
+    flight at once on a single event loop; the generator's rate limiter caps
+    the request rate. ``items`` is consumed lazily in a worker thread, so
+    elements still being parsed overlap with requests for earlier batches.
+
+    Results are yielded as soon as the batch holding them and all earlier
+    batches completed, and at most ``PENDING_BATCHES_PER_REQUEST`` times
+    ``max_concurrency`` batches are pending at once. A failing batch thus
+    only raises after the results of the batches before it were yielded.
+
+    Args:
+        generator (DocumentationGenerator): Generator used for each batch.
+        items (iterable): ``(element, ...)`` tuples to document.
+        context (dict): Project context passed to the generator.
+        max_concurrency (int): Maximum number of concurrent LLM requests.
+        batch_size (int): Maximum number of elements per LLM request.
+        desc (str): Progress bar description.
+
+    Yields:
+        tuple: ``(item, doc)`` pairs, in the same order as ``items``.
+    """
+    items = iter(items)
+    batch_size = max(1, batch_size)
+    max_pending = max(1, max_concurrency) * PENDING_BATCHES_PER_REQUEST
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    with asyncio.Runner() as runner, tqdm(total=0, desc=desc) as pbar:
+        loop = runner.get_loop()
+
+        async def run(batch):
+            async with semaphore:
+                docs = await generator.agenerate_docs_batch(
+                    [item[0] for item in batch], context, batch_size
+                )
+            pbar.update(len(batch))
+            return list(zip(batch, docs))
+
+        # Tasks still pending when the caller stops or a batch fails are
+        # cancelled when the runner closes
+        pending = deque()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                # Pending requests progress while the next batch is read
+                batch = loop.run_until_complete(
+                    asyncio.to_thread(lambda: list(islice(items, batch_size)))
+                )
+                if not batch:
+                    exhausted = True
+                    break
+                pbar.total += len(batch)
+                pbar.refresh()
+                pending.append(loop.create_task(run(batch)))
+            if not pending:
+                break
+            yield from loop.run_until_complete(pending.popleft())
@@ -0,0 +1,110 @@
+"""
+The `codantix doc-pr` command: document the changes of a pull request or commit.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import click
+from tqdm import tqdm
+
+from codantix.commands.common import (
+    FILE_HASHES_PATH,
+    FLUSH_SIZE,
+    HASHES_PATH,
+    LLM_CACHE_PATH,
+    build_metadata,
+    doc_id,
+    element_hash,
+    element_store_key,
+    embedding_manager,
+    forget_files,
+    forwarded,
+    semantic_cache,
+)
+from codantix.config import Config
+from codantix.hash_store import HashStore
+
+
+@click.command()
+@click.argument("sha")
+@click.option(
+    "--config", default=None, help="Path to configuration file (default: search local)"
+)
+@click.option(
+    "--version", default=None, help="Version identifier for the indexed code."
+)
+def doc_pr(sha: str, config, version):
+    """Document changes in a pull request.
+
+    Args:
+        sha (str): The commit SHA identifying the pull request or commit to document.
+        version (str, optional): Version identifier for the indexed code. If provided, this version will be included in the metadata for all indexed documents.
+
+    Scans the code changes in the specified commit, generates or updates documentation for changed elements,
+    and updates the vector database accordingly.
+
+    Raises:
+        SystemExit: If an error occurs during PR documentation.
+    """
+    if forwarded("doc-pr", sha=sha, config=config, version=version):
+        return
+    click.echo(f"Documenting changes in PR with SHA: {sha}")
+    try:
+        from codantix.incremental_doc import IncrementalDocumentation
+        from codantix.llm_cache import LLMCache
+
+        repo_path = Path(os.getcwd())
+        config_obj = Config.load(config)
+        inc = IncrementalDocumentation(
+            config_obj.name,
+            repo_path,
+            doc_style=config_obj.doc_style,
+            llm_config=config_obj.llm,
+            llm_cache=LLMCache(LLM_CACHE_PATH),
+            semantic_cache=semantic_cache(config_obj),
+            batch_size=config_obj.llm.batch_size,
+            max_concurrency=config_obj.llm.max_concurrency,
+        )
+        changes = inc.process_commit(sha)
+        emb_mgr = embedding_manager(config_obj)
+        hashes = HashStore(repo_path / HASHES_PATH)
+        file_hashes = HashStore(repo_path / FILE_HASHES_PATH)
+        salt = f"{config_obj.get_doc_style()}:{version}"
+        # Only elements of deleted files are reported as deleted, so rows are removed per file
+        deleted_files = set()
+
+        def iter_docs():
+            for change in tqdm(changes, desc="Processing changes"):
+                click.echo(
+                    f"{change.change_type.title()}: {change.element.file_path}::{change.element.name}"
+                )
+                if change.change_type in ("new", "update"):
+                    # Elements are indexed at their absolute path, as `init` indexes them
+                    element = change.element._replace(
+                        file_path=repo_path / change.element.file_path
+                    )
+                    digest = element_hash(element, salt)
+                    hashes.set(element_store_key(element), digest)
+                    yield {
+                        "id": doc_id(element, version),
+                        "text": change.new_doc,
+                        "metadata": build_metadata(element, version, digest),
+                    }
+                elif change.change_type == "D":
+                    deleted_files.add(str(repo_path / change.element.file_path))
+
+        emb_mgr.update_database(iter_docs(), FLUSH_SIZE)
+        # Vector stores without delete support leave stale entries in place
+        db_delete = getattr(emb_mgr.db, "delete", None)
+        if db_delete is not None and deleted_files:
+            # Remove all embeddings for deleted files in a single call
+            db_delete(where={"file_path": {"$in": sorted(deleted_files)}})
+        forget_files(deleted_files, file_hashes, hashes)
+        hashes.save()
+        file_hashes.save()
+        click.echo("PR documentation and vector database update complete.")
+    except Exception as e:
+        click.echo(f"Error during PR documentation: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,113 @@
+"""
+The `codantix init` command: document and index the entire repository.
+"""
+
+import os
+import sys
+
+import click
+
+from codantix.commands.common import (
+    FILE_HASHES_PATH,
+    FLUSH_SIZE,
+    HASHES_PATH,
+    build_metadata,
+    changed_elements,
+    changed_files,
+    doc_id,
+    element_store_key,
+    embedding_manager,
+    forwarded,
+    generate_docs,
+    remove_deleted_files,
+    setup,
+)
+from codantix.hash_store import HashStore
+
+
+@click.command()
+@click.option(
+    "--config", default=None, help="Path to configuration file (default: search local)"
+)
+@click.option(
+    "--version", default=None, help="Version identifier for the indexed code."
+)
+@click.option(
+    "--freeze",
+    is_flag=True,
+    default=False,
+    help="Freeze documentation: only extract and embed existing docstrings, do not generate or update.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Re-document and re-embed all elements, even if their content is unchanged.",
+)
+def init(config, version, freeze, force):
+    """Initialize and document the entire repository.
+
+    Scans all configured source paths, generates or updates documentation for all code elements,
+    and updates the vector database with the new documentation.
+
+    Args:
+        version (str, optional): Version identifier for the indexed code. If provided, this version will be included in the metadata for all indexed documents.
+        freeze (bool, optional): If set, only extract and embed existing docstrings without generating or updating documentation.
+        force (bool, optional): If set, process all elements even if their content hash matches the last indexed run.
+
+    Raises:
+        SystemExit: If an error occurs during initialization.
+    """
+    if forwarded("init", config=config, version=version, freeze=freeze, force=force):
+        return
+    click.echo("Initializing repository documentation...")
+    try:
+        config_obj, repo_path, generator, context, traverser = setup(config)
+        source_paths = config_obj.source_paths
+        emb_mgr = embedding_manager(config_obj)
+        hashes = HashStore(repo_path / HASHES_PATH)
+        file_hashes = HashStore(repo_path / FILE_HASHES_PATH)
+        salt = f"{'freeze' if freeze else config_obj.get_doc_style()}:{version}"
+
+        def iter_docs():
+            for src in source_paths:
+                files = changed_files(
+                    traverser.find_files(repo_path / src), file_hashes, salt, force
+                )
+                changed = changed_elements(
+                    traverser.iter_elements(files, os.cpu_count()),
+                    hashes,
+                    emb_mgr,
+                    salt,
+                    force,
+                )
+                if freeze:
+                    results = (
+                        (pair, pair[0].existing_doc or "") for pair in changed
+                    )
+                else:
+                    results = generate_docs(
+                        generator,
+                        changed,
+                        context,
+                        config_obj.llm.max_concurrency,
+                        config_obj.llm.batch_size,
+                        f"Processing {src}",
+                    )
+                for (element, digest), doc in results:
+                    metadata = build_metadata(element, version, digest)
+                    hashes.set(element_store_key(element), digest)
+                    yield {
+                        "id": doc_id(element, version),
+                        "text": doc,
+                        "metadata": metadata,
+                    }
+
+        emb_mgr.update_database(iter_docs(), FLUSH_SIZE)
+        remove_deleted_files(file_hashes, hashes, emb_mgr)
+        hashes.save()
+        file_hashes.save()
+        click.echo("Repository documentation and vector database update complete.")
+    except Exception as e:
+        click.echo(f"Error during initialization: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,50 @@
+"""
+The `codantix serve` command: keep models and clients loaded across commands.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from codantix.commands.common import embedding_manager
+from codantix.config import Config
+from codantix.server import SOCKET_PATH, serve as serve_commands
+
+
+@click.command()
+@click.option(
+    "--config", default=None, help="Path to configuration file (default: search local)"
+)
+@click.option(
+    "--socket",
+    "socket_path",
+    default=str(SOCKET_PATH),
+    show_default=True,
+    help="Path of the Unix socket to listen on.",
+)
+def serve(config, socket_path):
+    """Serve Codantix commands from a long-running process.
+
+    Loads LangChain and the configured embedding manager once, then runs the `init`,
+    `doc-pr` and `update-db` commands forwarded by other Codantix invocations in this
+    repository until interrupted.
+
+    Raises:
+        SystemExit: If the server cannot be started.
+    """
+    from codantix import doc_generator, incremental_doc  # noqa: F401
+    from codantix.cli import cli
+
+    try:
+        embedding_manager(Config.load(config))
+    except Exception as e:
+        click.echo(f"Warning: could not preload the embedding manager: {e}", err=True)
+    click.echo(f"Serving Codantix commands on {socket_path} (press Ctrl+C to stop)")
+    try:
+        serve_commands(cli, Path(socket_path))
+    except KeyboardInterrupt:
+        click.echo("Server stopped.")
+    except Exception as e:
+        click.echo(f"Error running server: {e}", err=True)
+        sys.exit(1)
@@ -6,14 +6,14 @@ and saving project configuration from JSON or YAML files.
 Supports default values, schema validation, and format conversion.
 """
 
-import json
-from dataclasses import dataclass
+import os
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-import yaml
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from codantix.utils import json_dumps, json_loads
 
 LANGUAGE_EXTENSION_MAP = {
     "python": {".py"},
@@ -21,6 +21,9 @@ LANGUAGE_EXTENSION_MAP = {
     "java": {".java"},
 }
 
+# Language of each supported file extension
+EXTENSION_LANGUAGE_MAP = {ext: lang for lang, exts in LANGUAGE_EXTENSION_MAP.items() for ext in exts}
+
 
 class DocStyle(str, Enum):
     """
@@ -43,12 +46,72 @@ class VectorDBType(str, Enum):
     MILVUS_LITE = "milvus_lite"
 
 
+# Accepted language names
+_LANGUAGES = frozenset(LANGUAGE_EXTENSION_MAP)
+
+# Configurations loaded from files, by absolute path, with the (mtime_ns, size) they were read at,
+# least recently used first
+_LOAD_CACHE: Dict[str, Tuple[Tuple[int, int], "Config"]] = {}
+_LOAD_CACHE_SIZE = 8
+
+# Configuration files looked up in the working directory, in order of preference
+_CONFIG_CANDIDATES = ("codantix.config.json", "codantix.config.yaml", "codantix.config.yml")
+
+# Buffer size for reading configuration files
+_READ_BUFFER_SIZE = 65536
+
+
+def _yaml_load(stream):
+    """
+    Parse a YAML document with the safe loader, using the libyaml bindings when available.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _yaml_dump(data, stream) -> None:
+    """
+    Write plain data as UTF-8 YAML to a binary stream with the safe dumper, using the libyaml
+    bindings when available. The document is rendered in memory and written in one call.
+    """
+    import yaml
+
+    stream.write(yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), encoding="utf-8"))
+
+
+def _json_load(stream):
+    """
+    Parse a JSON document from a binary stream.
+    """
+    return json_loads(stream.read())
+
+
+def _json_dump(data, stream) -> None:
+    """
+    Write data as indented UTF-8 JSON to a binary stream.
+    """
+    stream.write(json_dumps(data, indent=True))
+
+
+# Readers by file extension and writers by format name; anything else is treated as JSON.
+# The YAML reader consumes the stream in chunks and decodes it itself.
+_LOADERS = {".json": _json_load, ".yaml": _yaml_load, ".yml": _yaml_load}
+_SAVERS = {"json": _json_dump, "yaml": _yaml_dump}
+
+
 class ConfigValidationError(Exception):
     """
     Raised when configuration validation fails.
+
+    When raised without a message from a pydantic ``ValidationError``, the error report
+    is rendered from the cause only if the exception is displayed.
     """
 
-    pass
+    def __str__(self) -> str:
+        if not self.args and self.__cause__ is not None:
+            return str(self.__cause__)
+        return super().__str__()
 
 
 class RateLimitConfig(BaseModel):
@@ -56,8 +119,10 @@ class RateLimitConfig(BaseModel):
     Configuration for the rate limit.
     """
 
-    llm_requests_per_second: float = Field(
-        0.1, description="Max LLM requests per second"
+    model_config = ConfigDict(defer_build=True)
+
+    llm_requests_per_second: Optional[float] = Field(
+        None, description="Max LLM requests per second; None sends requests unthrottled"
     )
     llm_check_every_n_seconds: float = Field(
         0.1, description="How often to check if a request can be made (seconds)"
@@ -72,6 +137,8 @@ class LLMConfig(BaseModel):
     Configuration for the LLM.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     provider: str = Field("google_genai", description="LLM provider")
     llm_model: str = Field(
         "gemini-2.5-flash-preview-04-17", description="LLM model name"
@@ -86,6 +153,18 @@ class LLMConfig(BaseModel):
     rate_limit: RateLimitConfig = Field(
         default_factory=RateLimitConfig, description="Rate limit configuration"
     )
+    batch_size: int = Field(
+        8, description="Number of code elements documented per LLM request"
+    )
+    max_concurrency: int = Field(
+        8, description="Maximum number of concurrent LLM requests"
+    )
+    enable_semantic_cache: bool = Field(
+        False, description="Reuse cached answers of near-identical prompts"
+    )
+    semantic_threshold: float = Field(
+        0.97, description="Minimum prompt similarity for a semantic cache hit"
+    )
 
 
 class VectorDBConfig(BaseModel):
@@ -93,6 +172,8 @@ class VectorDBConfig(BaseModel):
     Configuration for the vector database.
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     type: VectorDBType = Field(VectorDBType.CHROMA, description="Vector database type")
     path: str = Field("vecdb/", description="Path to the vector database")
     provider: str = Field("huggingface", description="Provider for the vector database")
@@ -102,18 +183,12 @@ class VectorDBConfig(BaseModel):
     host: str = Field("localhost", description="Host for the vector database")
     port: Optional[int] = Field(None, description="Port for the vector database")
     persist_directory: str = Field("vecdb/", description="Path to the vector database")
-
-    @model_validator(mode="after")
-    def check_vector_db_type(self):
-        """
-        Validate the vector database type.
-        """
-        valid_types = [v.value for v in VectorDBType]
-        if self.type not in valid_types:
-            raise ConfigValidationError(
-                f"Unsupported vector_db type: {self.type}. Must be one of: {valid_types}"
-            )
-        return self
+    batch_size: int = Field(32, description="Number of texts per embedding request")
+    max_concurrency: int = Field(8, description="Maximum number of concurrent embedding requests")
+    async_embeddings: bool = Field(
+        False, description="Send concurrent embedding requests through the provider's async API"
+    )
+    quantize: bool = Field(False, description="Index vectors as int8 (Qdrant and Milvus)")
 
 
 class Config(BaseModel):
@@ -126,6 +201,9 @@ class Config(BaseModel):
         print(config.llm.rate_limit.llm_requests_per_second)
     """
 
+    # Validators and serializers are built on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
     doc_style: DocStyle = Field(DocStyle.GOOGLE, description="Documentation style")
     source_paths: list[str] = Field(
         default_factory=lambda: ["src"], description="Paths to source code files"
@@ -144,20 +222,14 @@ class Config(BaseModel):
     )
 
     @model_validator(mode="after")
-    def check_vector_db_type(self):
+    def check_languages(self):
         """
         Validates the configuration.
-        """
-        valid_types = [v.value for v in DocStyle]
-        if self.doc_style not in valid_types:
-            raise ConfigValidationError(
-                f"Unsupported doc_style: {self.doc_style}. Must be one of: {valid_types}"
-            )
 
-        is_valid_language = [
-            lang for lang in self.languages if lang in LANGUAGE_EXTENSION_MAP.keys()
-        ]
-        if not is_valid_language:
+        ``doc_style`` and ``vector_db.type`` are already constrained by their enum types
+        during validation; only the language list needs a cross-check.
+        """
+        if _LANGUAGES.isdisjoint(self.languages):
             raise ConfigValidationError(
                 f"Unsupported language: {self.languages}. Must be one of: {LANGUAGE_EXTENSION_MAP.keys()}"
             )
@@ -167,61 +239,69 @@ class Config(BaseModel):
     def load(cls, config_path: Optional[str | Path] = None) -> "Config":
         """
         Load configuration from file (JSON or YAML) or use defaults.
-        """
-        import os
 
-        path = str(config_path) if config_path else None
+        Files are parsed and validated once per process while unchanged; each call returns
+        its own copy, so callers may modify it.
+        """
+        path = os.fspath(config_path) if config_path else None
         if not path:
-            # Try to find config in current working directory
-            for candidate in [
-                "codantix.config.json",
-                "codantix.config.yaml",
-                "codantix.config.yml",
-            ]:
-                if os.path.exists(candidate):
-                    path = candidate
-                    break
+            # Try to find config in current working directory, listing it once
+            with os.scandir(".") as entries:
+                names = {entry.name for entry in entries if entry.name.startswith("codantix.config.")}
+            path = next((candidate for candidate in _CONFIG_CANDIDATES if candidate in names), None)
+        abs_path = stamp = None
         if not path:
             data = {}
             path = None
         else:
             try:
-                with open(path, "r") as f:
-                    if path.endswith(".yaml") or path.endswith(".yml"):
-                        data = yaml.safe_load(f)
-                    else:
-                        data = json.load(f)
+                stat = os.stat(path)
+                abs_path, stamp = os.path.abspath(path), (stat.st_mtime_ns, stat.st_size)
+                cached = _LOAD_CACHE.pop(abs_path, None)
+                if cached is not None and cached[0] == stamp and type(cached[1]) is cls:
+                    _LOAD_CACHE[abs_path] = cached
+                    obj = cached[1].model_copy(deep=True)
+                    obj.config_path = path
+                    return obj
+                loader = _LOADERS.get(os.path.splitext(path)[1].lower(), _json_load)
+                with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                    data = loader(f)
             except FileNotFoundError:
                 data = {}
-        try:
-            obj = cls(**data)
+                stamp = None
+        if not data:
+            # Nothing to validate: the field defaults are valid by construction
+            obj = cls.model_construct()
             obj.config_path = path
             return obj
+        try:
+            obj = cls.model_validate(data)
+            obj.config_path = path
         except ValidationError as e:
-            raise ConfigValidationError(str(e))
+            raise ConfigValidationError() from e
+        if stamp is not None:
+            if len(_LOAD_CACHE) >= _LOAD_CACHE_SIZE:
+                del _LOAD_CACHE[next(iter(_LOAD_CACHE))]
+            _LOAD_CACHE[abs_path] = (stamp, obj.model_copy(deep=True))
+        return obj
+
+    @classmethod
+    def clear_load_cache(cls) -> None:
+        """
+        Forget all configurations cached by :meth:`load`, so the next load re-reads its file.
+        """
+        _LOAD_CACHE.clear()
 
     def save(self, path: Optional[str] = None, format: str = "json") -> None:
         """
         Save configuration to file.
         """
         save_path = path or self.config_path or "codantix.config.json"
-        import enum
-
-        def enum_to_value(obj):
-            if isinstance(obj, dict):
-                return {k: enum_to_value(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [enum_to_value(i) for i in obj]
-            elif isinstance(obj, enum.Enum):
-                return obj.value
-            return obj
-
-        data = enum_to_value(self.model_dump(exclude={"config_path"}))
-        with open(save_path, "w") as f:
-            if format.lower() == "yaml":
-                yaml.dump(data, f)
-            else:
-                json.dump(data, f, indent=2)
+        # Enum fields may hold plain strings assigned after validation; they serialize as-is
+        data = self.model_dump(mode="json", exclude={"config_path"}, warnings=False)
+        saver = _SAVERS.get(format.lower(), _json_dump)
+        with open(save_path, "wb") as f:
+            saver(data, f)
 
     # Property accessors for compatibility
     def get_doc_style(self) -> str:
@@ -250,9 +330,11 @@ class ElementType(Enum):
     METHOD = "method"
 
 
-@dataclass
-class CodeElement:
-    """Represents a code element that needs documentation."""
+class CodeElement(NamedTuple):
+    """Represents a code element that needs documentation.
+
+    Elements are immutable; use ``element._replace(...)`` to derive an updated copy.
+    """
 
     name: str
     type: ElementType
@@ -261,3 +343,4 @@ class CodeElement:
     docstring: Optional[str] = None
     existing_doc: Optional[str] = None
     parent: Optional[str] = None
+    source: Optional[str] = None
@@ -5,19 +5,29 @@ This module provides the DocumentationGenerator class, which generates documenta
 Supports Google, NumPy, and JSDoc styles.
 """
 
+import asyncio
+import json
 import logging
+import string
+import time
+import traceback
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain.chat_models import init_chat_model
 from langchain_core.callbacks import get_usage_metadata_callback
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
 
 from codantix.config import DocStyle, ElementType, LLMConfig
 from codantix.documentation import CodeElement
+from codantix.llm_cache import LLMCache, SemanticCache, request_key
+from codantix.utils import RATE_LIMIT_ATTEMPTS, _backoff_delay, _is_rate_limited
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocTemplate:
     """Template for different documentation styles."""
 
@@ -28,90 +38,25 @@ class DocTemplate:
     method_template: str
 
 
-class DocumentationGenerator:
-    """
-    Generates documentation for code elements.
-
-    Uses LLMs and customizable templates to generate docstrings for modules, classes, functions, and methods.
-    Supports Google, NumPy, and JSDoc documentation styles.
-    """
-
-    def __init__(
-        self,
-        doc_style: DocStyle = DocStyle.GOOGLE,
-        llm_config: Optional[LLMConfig] = None,
-        llm: Optional[BaseChatModel] = None,
-    ):
-        """
-        Initialize the DocumentationGenerator.
-
-        Args:
-            doc_style (DocStyle): The documentation style to use.
-            llm_config (LLMConfig): The configuration for the LLM.
-            llm (BaseChatModel): The LLM to use.
-
-        Config options for rate limiting (all optional, with defaults):
-            llm_requests_per_second: float, default 0.1
-            llm_check_every_n_seconds: float, default 0.1
-            llm_max_bucket_size: int, default 10
-        """
-        assert doc_style in DocStyle, f"Invalid doc_style: {doc_style}. Must be one of: {DocStyle}"
-        self.doc_style = doc_style
-        self.llm_config = llm_config or LLMConfig()
-        self.templates = self._get_templates()
-        self.llm = llm or self._init_llm()
-
-    def _init_llm(self):
-        """
-        Initialize the LLM based on provider and config.
-        Returns:
-            LLM instance compatible with LangChain.
-        Raises:
-            ImportError: If the required LLM provider is not installed.
-            ValueError: If required API keys are not set in the environment.
-            NotImplementedError: If the provider is not supported.
-        """
-        provider = self.llm_config.provider
-        llm_model = self.llm_config.llm_model
-        try:
-            return init_chat_model(
-                model_provider=provider,
-                model=llm_model,
-                temperature=self.llm_config.temperature,
-                max_tokens=self.llm_config.max_tokens,
-                top_p=self.llm_config.top_p,
-                top_k=self.llm_config.top_k,
-            )
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to initialize chat model for provider '{provider}' and model '{llm_model}': {e}"
-            )
-
-    def _get_templates(self) -> Dict[DocStyle, DocTemplate]:
-        """
-        Get documentation templates for different styles.
-
-        Returns:
-            Dict[DocStyle, DocTemplate]: Mapping of documentation styles to their templates.
-        """
-        return {
-            DocStyle.GOOGLE: DocTemplate(
-                style=DocStyle.GOOGLE,
-                module_template="""\"\"\"
+# Documentation templates for each style, built once at import time
+_TEMPLATES: Dict[DocStyle, DocTemplate] = {
+    DocStyle.GOOGLE: DocTemplate(
+        style=DocStyle.GOOGLE,
+        module_template="""\"\"\"
 {description}
 
 This module is part of {project_name}.
 
 {architecture_context}
 \"\"\"""",
-                class_template="""\"\"\"
+        class_template="""\"\"\"
 {description}
 
 {attributes}
 
 {methods}
 \"\"\"""",
-                function_template="""\"\"\"
+        function_template="""\"\"\"
 {description}
 
 Args:
@@ -123,7 +68,7 @@ Returns:
 Raises:
 {raises}
 \"\"\"""",
-                method_template="""\"\"\"
+        method_template="""\"\"\"
 {description}
 
 Args:
@@ -135,17 +80,17 @@ Returns:
 Raises:
 {raises}
 \"\"\"""",
-            ),
-            DocStyle.NUMPY: DocTemplate(
-                style=DocStyle.NUMPY,
-                module_template="""\"\"\"
+    ),
+    DocStyle.NUMPY: DocTemplate(
+        style=DocStyle.NUMPY,
+        module_template="""\"\"\"
 {description}
 
 This module is part of {project_name}.
 
 {architecture_context}
 \"\"\"""",
-                class_template="""\"\"\"
+        class_template="""\"\"\"
 {description}
 
 Attributes
@@ -156,7 +101,7 @@ Methods
 -------
 {methods}
 \"\"\"""",
-                function_template="""\"\"\"
+        function_template="""\"\"\"
 {description}
 
 Parameters
@@ -171,7 +116,7 @@ Raises
 ------
 {raises}
 \"\"\"""",
-                method_template="""\"\"\"
+        method_template="""\"\"\"
 {description}
 
 Parameters
@@ -186,10 +131,10 @@ Raises
 ------
 {raises}
 \"\"\"""",
-            ),
-            DocStyle.JSDOC: DocTemplate(
-                style=DocStyle.JSDOC,
-                module_template="""/**
+    ),
+    DocStyle.JSDOC: DocTemplate(
+        style=DocStyle.JSDOC,
+        module_template="""/**
  * {description}
  *
  * @module {module_name}
@@ -197,7 +142,7 @@ Raises
  *
  * {architecture_context}
  */""",
-                class_template="""/**
+        class_template="""/**
  * {description}
  *
  * @class {class_name}
@@ -205,7 +150,7 @@ Raises
  *
  * @property {properties}
  */""",
-                function_template="""/**
+        function_template="""/**
  * {description}
  *
  * @function {function_name}
@@ -213,7 +158,7 @@ Raises
  * @returns {returns}
  * @throws {throws}
  */""",
-                method_template="""/**
+        method_template="""/**
  * {description}
  *
  * @method {method_name}
@@ -221,8 +166,248 @@ Raises
  * @returns {returns}
  * @throws {throws}
  */""",
-            ),
-        }
+    ),
+}
+
+# Template fields that are empty unless set for the element being formatted; copied per call
+_BLANK_FORMAT_ARGS: Dict[str, str] = {
+    "description": "",
+    "project_name": "",
+    "architecture_context": "",
+    "module_name": "",
+    "class_name": "",
+    "function_name": "",
+    "method_name": "",
+    "args": "",  # These would be extracted from the code
+    "returns": "",
+    "raises": "",
+    "attributes": "",
+    "methods": "",
+    "properties": "",
+    "params": "",
+    "throws": "",
+}
+
+# Template field holding the element name, for each element type
+_NAME_FIELDS = {
+    ElementType.MODULE: "module_name",
+    ElementType.CLASS: "class_name",
+    ElementType.FUNCTION: "function_name",
+    ElementType.METHOD: "method_name",
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Compile a format template into a function that fills it from a dict of field values.
+
+    The template is tokenized once; rendering then only joins its literal parts with the field
+    values. Templates using conversions, format specs or non-name fields fall back to
+    ``str.format``. As with ``str.format``, a missing field raises KeyError.
+
+    Args:
+        template (str): A ``str.format`` template with named fields.
+
+    Returns:
+        Callable[[Dict[str, str]], str]: The renderer.
+    """
+    parts = []
+    for literal, name, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append((True, literal))
+        if name is None:
+            continue
+        if format_spec or conversion or not name.isidentifier():
+            return lambda values: template.format(**values)
+        parts.append((False, name))
+
+    def render(values: Dict[str, str]) -> str:
+        return "".join(part if is_literal else str(values[part]) for is_literal, part in parts)
+
+    return render
+
+
+@lru_cache(maxsize=1024)
+def _first_line(text: str) -> str:
+    """
+    Return the first line of a text, stripped.
+
+    Cached because the same project and module descriptions are summarized for every element.
+    """
+    return text.partition("\n")[0].strip()
+
+
+# Known provider failures: substrings of the lowercased error message, and the message to report
+_ERROR_MESSAGES = (
+    (
+        ("rate limit", "429"),
+        "LLM rate limit exceeded. Please wait and try again. See: https://python.langchain.com/docs/how_to/chat_model_rate_limiting/",
+    ),
+    (
+        ("quota", "exceeded your current quota"),
+        "LLM quota exceeded for your API key/account. Please check your provider dashboard.",
+    ),
+    (
+        ("not found", "model not found", "downloaded"),
+        "Requested LLM model not found or not downloaded. Please check your model name and provider.",
+    ),
+    (
+        ("permission", "unauthorized", "forbidden"),
+        "Permission denied or unauthorized to use the selected LLM/model. Please check your API key and permissions.",
+    ),
+)
+
+
+def _llm_error(error: Exception) -> RuntimeError:
+    """
+    Translate an LLM provider exception into a RuntimeError with an actionable message.
+
+    Args:
+        error (Exception): The exception raised by LangChain or the provider SDK.
+
+    Returns:
+        RuntimeError: The error to raise in its place.
+    """
+    # LangChain and provider-specific error handling
+    msg = str(error).lower()
+    for patterns, message in _ERROR_MESSAGES:
+        if any(pattern in msg for pattern in patterns):
+            return RuntimeError(message)
+    tb = "".join(traceback.format_exception(error))
+    return RuntimeError(f"LLM error: {error}\nTraceback:\n{tb}")
+
+
+def _response_text(response) -> str:
+    """Return the text content of an LLM response, or the response itself if it has none."""
+    content = getattr(response, "content", response)
+    return content if isinstance(content, str) else response
+
+
+def _parse_batch_response(text: str) -> Dict[int, str]:
+    """
+    Parse a batched LLM answer of the form ``[{"id": 1, "doc": "..."}]``.
+
+    Returns:
+        Dict[int, str]: Documentation keyed by element number; empty if the answer is not valid JSON.
+    """
+    if not isinstance(text, str):
+        return {}
+    text = text.strip()
+    # Models often wrap JSON answers in a markdown code fence
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find("\n") + 1 :] if "\n" in text else ""
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+    return {
+        item["id"]: item["doc"]
+        for item in items
+        if isinstance(item, dict) and isinstance(item.get("id"), int) and isinstance(item.get("doc"), str)
+    }
+
+
+def _pending_batches(docs: List[Optional[str]], k: int) -> List[List[int]]:
+    """
+    Split the positions of the elements that still need documentation into batches of at most ``k``.
+    """
+    pending = [i for i, doc in enumerate(docs) if doc is None]
+    size = max(1, k)
+    return [pending[start : start + size] for start in range(0, len(pending), size)]
+
+
+class DocumentationGenerator:
+    """
+    Generates documentation for code elements.
+
+    Uses LLMs and customizable templates to generate docstrings for modules, classes, functions, and methods.
+    Supports Google, NumPy, and JSDoc documentation styles.
+    """
+
+    def __init__(
+        self,
+        doc_style: DocStyle = DocStyle.GOOGLE,
+        llm_config: Optional[LLMConfig] = None,
+        llm: Optional[BaseChatModel] = None,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        """
+        Initialize the DocumentationGenerator.
+
+        Args:
+            doc_style (DocStyle): The documentation style to use.
+            llm_config (LLMConfig): The configuration for the LLM.
+            llm (BaseChatModel): The LLM to use. If omitted, the configured model is created on
+                first use, so building a generator does not load the provider SDK.
+            cache (LLMCache, optional): Cache of earlier LLM answers; requests found in it are
+                not sent to the LLM.
+            semantic_cache (SemanticCache, optional): Cache of earlier LLM answers looked up by
+                prompt similarity, consulted when ``cache`` has no answer.
+
+        Config options for rate limiting (all optional, with defaults):
+            llm_requests_per_second: float, default None (no client-side rate limit)
+            llm_check_every_n_seconds: float, default 0.1
+            llm_max_bucket_size: int, default 10
+        """
+        assert doc_style in DocStyle, f"Invalid doc_style: {doc_style}. Must be one of: {DocStyle}"
+        self.doc_style = doc_style
+        self.llm_config = llm_config or LLMConfig()
+        self.templates = _TEMPLATES
+        self._llm = llm
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        # Futures of async LLM requests in progress, by request key
+        self._inflight: Dict[bytes, asyncio.Future] = {}
+        self.reset_context()
+
+    @cached_property
+    def llm(self) -> BaseChatModel:
+        """
+        The LLM used to generate documentation, created from the configuration on first access.
+        """
+        return self._llm or self._init_llm()
+
+    def _init_llm(self):
+        """
+        Initialize the LLM based on provider and config.
+        Returns:
+            LLM instance compatible with LangChain.
+        Raises:
+            ImportError: If the required LLM provider is not installed.
+            ValueError: If required API keys are not set in the environment.
+            NotImplementedError: If the provider is not supported.
+        """
+        provider = self.llm_config.provider
+        llm_model = self.llm_config.llm_model
+        rate_limit = self.llm_config.rate_limit
+        # A single limiter on the shared model throttles all concurrent callers; it is only
+        # built when a rate is set, since requests otherwise wait for the bucket to fill
+        rate_limiter = None
+        if rate_limit.llm_requests_per_second:
+            rate_limiter = InMemoryRateLimiter(
+                requests_per_second=rate_limit.llm_requests_per_second,
+                check_every_n_seconds=rate_limit.llm_check_every_n_seconds,
+                max_bucket_size=rate_limit.llm_max_bucket_size,
+            )
+        try:
+            return init_chat_model(
+                model_provider=provider,
+                model=llm_model,
+                temperature=self.llm_config.temperature,
+                max_tokens=self.llm_config.max_tokens,
+                top_p=self.llm_config.top_p,
+                top_k=self.llm_config.top_k,
+                rate_limiter=rate_limiter,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to initialize chat model for provider '{provider}' and model '{llm_model}': {e}"
+            )
 
     def generate_doc(self, element: CodeElement, context: Dict[str, str]) -> str:
         """
@@ -240,58 +425,352 @@ Raises
         if element.existing_doc:
             return element.existing_doc
 
-        template = self.templates[self.doc_style]
-        # Get the appropriate template based on element type
-        if element.type == ElementType.MODULE:
-            doc_template = template.module_template
-        elif element.type == ElementType.CLASS:
-            doc_template = template.class_template
-        elif element.type == ElementType.FUNCTION:
-            doc_template = template.function_template
-        else:  # METHOD
-            doc_template = template.method_template
-
         # Generate documentation using LLM
         prompt = self._create_prompt(element, context)
-        try:
-            if self.llm:
-                messages = [
-                    {
-                        "role": "system",
-                        "content": "You are a documentation expert. Generate clear and concise documentation.",
-                    },
-                    {"role": "user", "content": prompt},
-                ]
+        return self._invoke_llm(prompt)
+
+    def generate_docs_batch(
+        self, elements: List[CodeElement], context: Dict[str, str], k: int = 8
+    ) -> List[str]:
+        """
+        Generate documentation for several code elements, packing up to ``k`` elements into each LLM call.
+
+        Elements that already have documentation are returned unchanged, and elements answered
+        before (see :meth:`_cached_docs`) are not sent again. If the model's answer for a batch
+        cannot be parsed, or omits an element, those elements fall back to :meth:`generate_doc`.
+
+        Args:
+            elements (List[CodeElement]): The code elements to document.
+            context (Dict[str, str]): Project context for documentation.
+            k (int): Maximum number of elements per LLM call.
+
+        Returns:
+            List[str]: The generated documentation, in the same order as ``elements``.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        docs: List[Optional[str]] = [element.existing_doc or None for element in elements]
+        requests = self._cached_docs(elements, context, docs)
+        if self.semantic_cache is not None and requests:
+            vectors = self.semantic_cache.embed([prompt for _, prompt, _ in requests.values()])
+            self._semantic_cached_docs(requests, vectors, docs)
+        for batch in _pending_batches(docs, k):
+            if len(batch) == 1:
+                docs[batch[0]] = _response_text(self.generate_doc(elements[batch[0]], context))
+                continue
+            prompt = self._create_batch_prompt([elements[i] for i in batch], context)
+            parsed = _parse_batch_response(_response_text(self._invoke_llm(prompt)))
+            for number, i in enumerate(batch, start=1):
+                doc = parsed.get(number)
+                if doc is None:
+                    doc = _response_text(self.generate_doc(elements[i], context))
+                elif i in requests:
+                    key, element_prompt, vector = requests[i]
+                    self._cache_response(key, element_prompt, AIMessage(content=doc), vector)
+                docs[i] = doc
+        return docs
+
+    async def agenerate_doc(self, element: CodeElement, context: Dict[str, str]) -> str:
+        """
+        Asynchronously generate documentation for a code element.
+
+        Args:
+            element (CodeElement): The code element to document.
+            context (Dict[str, str]): Project context for documentation.
+
+        Returns:
+            str: The generated documentation string.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        if element.existing_doc:
+            return element.existing_doc
+        return await self._ainvoke_llm(self._create_prompt(element, context))
+
+    async def agenerate_many(
+        self, elements: List[CodeElement], context: Dict[str, str], max_concurrency: int = 8
+    ) -> List[str]:
+        """
+        Asynchronously document elements one per LLM call, with up to ``max_concurrency`` calls in flight.
+
+        Args:
+            elements (List[CodeElement]): The code elements to document.
+            context (Dict[str, str]): Project context for documentation.
+            max_concurrency (int): Maximum number of concurrent LLM requests.
+
+        Returns:
+            List[str]: The generated documentation, in the same order as ``elements``.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(element: CodeElement) -> str:
+            async with semaphore:
+                return await self.agenerate_doc(element, context)
+
+        return await asyncio.gather(*(run(element) for element in elements))
+
+    async def agenerate_docs_batch(
+        self, elements: List[CodeElement], context: Dict[str, str], k: int = 8
+    ) -> List[str]:
+        """
+        Asynchronous counterpart of :meth:`generate_docs_batch`.
+
+        Args:
+            elements (List[CodeElement]): The code elements to document.
+            context (Dict[str, str]): Project context for documentation.
+            k (int): Maximum number of elements per LLM call.
+
+        Returns:
+            List[str]: The generated documentation, in the same order as ``elements``.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        docs: List[Optional[str]] = [element.existing_doc or None for element in elements]
+        requests = self._cached_docs(elements, context, docs)
+        if self.semantic_cache is not None and requests:
+            vectors = await self.semantic_cache.aembed([prompt for _, prompt, _ in requests.values()])
+            self._semantic_cached_docs(requests, vectors, docs)
+        for batch in _pending_batches(docs, k):
+            if len(batch) == 1:
+                docs[batch[0]] = _response_text(await self.agenerate_doc(elements[batch[0]], context))
+                continue
+            prompt = self._create_batch_prompt([elements[i] for i in batch], context)
+            parsed = _parse_batch_response(_response_text(await self._ainvoke_llm(prompt)))
+            for number, i in enumerate(batch, start=1):
+                doc = parsed.get(number)
+                if doc is None:
+                    doc = _response_text(await self.agenerate_doc(elements[i], context))
+                elif i in requests:
+                    key, element_prompt, vector = requests[i]
+                    self._cache_response(key, element_prompt, AIMessage(content=doc), vector)
+                docs[i] = doc
+        return docs
+
+    def _messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for a documentation prompt.
+        """
+        return [
+            {
+                "role": "system",
+                "content": "You are a documentation expert. Generate clear and concise documentation.",
+            },
+            {"role": "user", "content": prompt},
+        ]
+
+    def _invoke_llm(self, prompt: str):
+        """
+        Send a documentation prompt to the LLM, translating provider errors.
+
+        Args:
+            prompt (str): The user prompt to send.
+
+        Returns:
+            The LLM response message.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        messages = self._messages(prompt)
+        key = self._request_key(messages)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        vector = None
+        if self.semantic_cache is not None:
+            vector = self.semantic_cache.embed([prompt])[0]
+            cached = self._semantic_cached_response(vector)
+            if cached is not None:
+                return cached
+        if not self.llm:
+            raise _llm_error(RuntimeError("No LLM available."))
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            try:
                 with get_usage_metadata_callback() as cb:
                     response = self.llm.invoke(messages)
                     logging.info(cb.usage_metadata)
+                break
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    raise _llm_error(e) from e
+                time.sleep(_backoff_delay(attempt))
+        self._cache_response(key, prompt, response, vector)
+        return response
+
+    async def _ainvoke_llm(self, prompt: str):
+        """
+        Asynchronously send a documentation prompt to the LLM, translating provider errors.
+
+        Args:
+            prompt (str): The user prompt to send.
+
+        Returns:
+            The LLM response message.
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        messages = self._messages(prompt)
+        key = self._request_key(messages)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        vector = None
+        if self.semantic_cache is not None:
+            vector = (await self.semantic_cache.aembed([prompt]))[0]
+            cached = self._semantic_cached_response(vector)
+            if cached is not None:
+                return cached
+        # An identical request already in flight is awaited instead of sent again
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await self._ainvoke_with_retries(messages)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved, in case no other caller was waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+        finally:
+            del self._inflight[key]
+        self._cache_response(key, prompt, response, vector)
+        return response
+
+    async def _ainvoke_with_retries(self, messages: List[Dict[str, str]]):
+        """
+        Send chat messages to the LLM, retrying rate-limit errors with backoff.
+
+        Raises:
+            RuntimeError: If the LLM is not available or fails for a known reason.
+        """
+        if not self.llm:
+            raise _llm_error(RuntimeError("No LLM available."))
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            try:
+                with get_usage_metadata_callback() as cb:
+                    response = await self.llm.ainvoke(messages)
+                    logging.info(cb.usage_metadata)
                 return response
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    raise _llm_error(e) from e
+                await asyncio.sleep(_backoff_delay(attempt))
+
+    def _cached_docs(
+        self, elements: List[CodeElement], context: Dict[str, str], docs: List[Optional[str]]
+    ) -> Dict[int, Tuple[bytes, str, Any]]:
+        """
+        Fill in ``docs`` for elements whose own documentation request was answered before.
+
+        Batched answers are cached per element, under the key of the single-element request, so
+        an element is found again whichever batch it was documented in. Only the exact response
+        cache is checked here; callers embed the remaining prompts together and pass them to
+        :meth:`_semantic_cached_docs`.
+
+        Args:
+            elements (List[CodeElement]): The code elements to document.
+            context (Dict[str, str]): Project context for documentation.
+            docs (List[Optional[str]]): Documentation found so far, None where missing; updated in place.
+
+        Returns:
+            Dict[int, Tuple[bytes, str, Any]]: The request key, prompt and prompt vector (None
+            until embedded) of each element still undocumented, by position; empty when no
+            response cache is enabled.
+        """
+        if self.cache is None and self.semantic_cache is None:
+            return {}
+        requests = {}
+        for i, doc in enumerate(docs):
+            if doc is not None:
+                continue
+            prompt = self._create_prompt(elements[i], context)
+            key = self._request_key(self._messages(prompt))
+            cached = self._cached_response(key)
+            if cached is not None:
+                docs[i] = cached.content
             else:
-                raise RuntimeError("No LLM available.")
-        except Exception as e:
-            # LangChain and provider-specific error handling
-            import traceback
-
-            tb = traceback.format_exc()
-            msg = str(e).lower()
-            if "rate limit" in msg or "429" in msg:
-                raise RuntimeError(
-                    "LLM rate limit exceeded. Please wait and try again. See: https://python.langchain.com/docs/how_to/chat_model_rate_limiting/"
-                ) from e
-            elif "quota" in msg or "exceeded your current quota" in msg:
-                raise RuntimeError(
-                    "LLM quota exceeded for your API key/account. Please check your provider dashboard."
-                ) from e
-            elif "not found" in msg or "model not found" in msg or "downloaded" in msg:
-                raise RuntimeError(
-                    "Requested LLM model not found or not downloaded. Please check your model name and provider."
-                ) from e
-            elif "permission" in msg or "unauthorized" in msg or "forbidden" in msg:
-                raise RuntimeError(
-                    "Permission denied or unauthorized to use the selected LLM/model. Please check your API key and permissions."
-                ) from e
+                requests[i] = (key, prompt, None)
+        return requests
+
+    def _semantic_cached_docs(
+        self, requests: Dict[int, Tuple[bytes, str, Any]], vectors: List[Any], docs: List[Optional[str]]
+    ) -> None:
+        """
+        Fill in ``docs`` from the semantic cache, for the requests left by :meth:`_cached_docs`.
+
+        Args:
+            requests (Dict[int, Tuple[bytes, str, Any]]): Undocumented elements by position;
+                answered ones are removed, and the others get their prompt vector.
+            vectors (List[Any]): The prompt vectors, in the order of ``requests``.
+            docs (List[Optional[str]]): Documentation found so far; updated in place.
+        """
+        for (i, (key, prompt, _)), vector in zip(list(requests.items()), vectors):
+            cached = self._semantic_cached_response(vector)
+            if cached is not None:
+                docs[i] = cached.content
+                del requests[i]
             else:
-                raise RuntimeError(f"LLM error: {e}\nTraceback:\n{tb}") from e
+                requests[i] = (key, prompt, vector)
+
+    def _request_key(self, messages: List[Dict[str, str]]) -> bytes:
+        """
+        Key identifying an LLM request, for the response cache and in-flight deduplication.
+
+        The key covers the messages, the model and the sampling parameters, but not credentials.
+        """
+        config = self.llm_config
+        params = {
+            "temperature": config.temperature,
+            "top_p": config.top_p,
+            "top_k": config.top_k,
+            "max_tokens": config.max_tokens,
+            "stop_sequences": config.stop_sequences,
+        }
+        return request_key(messages, self._model_name(), params)
+
+    def _cached_response(self, key: bytes) -> Optional[AIMessage]:
+        """
+        Look up an earlier answer to the exact same request.
+        """
+        if self.cache is not None and (cached := self.cache.get(key)) is not None:
+            return AIMessage(content=cached)
+        return None
+
+    def _semantic_cached_response(self, vector) -> Optional[AIMessage]:
+        """
+        Look up an earlier answer to a similar prompt, given the prompt's vector.
+        """
+        cached = self.semantic_cache.lookup(vector, self._model_name())
+        return AIMessage(content=cached) if cached is not None else None
+
+    def _cache_response(self, key: bytes, prompt: str, response, vector=None) -> None:
+        """
+        Store the text of an LLM answer in the response caches that are enabled.
+
+        ``vector`` is the prompt's embedding if it was computed for the lookup, so the
+        semantic cache does not embed the prompt again.
+        """
+        content = getattr(response, "content", None)
+        if not isinstance(content, str):
+            return
+        if self.cache is not None:
+            self.cache.set(key, content, self.llm_config.llm_model)
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(prompt, content, self._model_name(), vector)
+
+    def _model_name(self) -> str:
+        """
+        Provider and model name of the configured LLM, e.g. ``openai:gpt-4``.
+        """
+        return f"{self.llm_config.provider}:{self.llm_config.llm_model}"
 
     def _get_hierarchy_context(self, element: CodeElement, context: Dict[str, str]) -> str:
         """
@@ -309,41 +788,61 @@ Raises
         Returns:
             str: Hierarchy context as minimal one-line rows, most general first.
         """
-        lines = []
-        # Package/project context
+        lines = [
+            self._package_line(context),
+            self._module_line(element, context),
+            self._class_line(element, context),
+        ]
+        return "\n".join(line for line in lines if line)
+
+    def reset_context(self) -> None:
+        """
+        Forget the hierarchy rows cached for the current project context.
+
+        The cache is also reset automatically whenever a different context dict is passed in.
+        """
+        self._hierarchy_context = None
+        self._module_lines = {}
+
+    def _package_line(self, context: Dict[str, str]) -> str:
+        """
+        Hierarchy row describing the package, or "" if the context has no purpose or description.
+        """
         pkg_purpose = context.get("purpose") or context.get("description")
-        if pkg_purpose:
-            lines.append(f"Package: {pkg_purpose.splitlines()[0].strip()}")
-        # Module context
-        module_doc = None
-        if element.type in {
-            ElementType.MODULE,
-            ElementType.CLASS,
-            ElementType.FUNCTION,
-            ElementType.METHOD,
-        }:
-            # Try to get module docstring from context if available
+        return f"Package: {_first_line(pkg_purpose)}" if pkg_purpose else ""
+
+    def _module_line(self, element: CodeElement, context: Dict[str, str]) -> str:
+        """
+        Hierarchy row describing the element's module, or "" if its docstring is unknown.
+
+        Rows are computed once per file for a given context, since every element of a file
+        shares them.
+        """
+        if context is not self._hierarchy_context:
+            self._hierarchy_context = context
+            self._module_lines = {}
+        line = self._module_lines.get(element.file_path)
+        if line is None:
+            # Module docstring from the context, or from context['module_docs'] (file_path -> doc)
             module_doc = context.get("module_doc")
-            if not module_doc and hasattr(element, "file_path") and element.file_path:
-                # Try to extract from context['module_docs'] if present (dict of file_path->doc)
-                module_docs = context.get("module_docs")
-                if module_docs and str(element.file_path) in module_docs:
-                    module_doc = module_docs[str(element.file_path)]
-        if module_doc:
-            lines.append(f"Module: {module_doc.splitlines()[0].strip()}")
-        # Class context
-        if element.type in {ElementType.CLASS, ElementType.METHOD} and hasattr(element, "parent"):
-            class_doc = None
-            # Try to get class docstring from context if available
-            class_docs = context.get("class_docs")
-            if class_docs and element.parent in class_docs:
-                class_doc = class_docs[element.parent]
-            # Fallback: if this is a class, use its own docstring
-            if element.type == ElementType.CLASS and element.existing_doc:
-                class_doc = element.existing_doc
-            if class_doc:
-                lines.append(f"Class: {class_doc.splitlines()[0].strip()}")
-        return "\n".join(lines)
+            if not module_doc and element.file_path:
+                module_doc = (context.get("module_docs") or {}).get(str(element.file_path))
+            line = f"Module: {_first_line(module_doc)}" if module_doc else ""
+            self._module_lines[element.file_path] = line
+        return line
+
+    def _class_line(self, element: CodeElement, context: Dict[str, str]) -> str:
+        """
+        Hierarchy row describing the class of a class or method, or "" if its docstring is unknown.
+        """
+        if element.type not in (ElementType.CLASS, ElementType.METHOD):
+            return ""
+        # A class's own docstring takes precedence over context['class_docs'] (class name -> doc)
+        if element.type == ElementType.CLASS and element.existing_doc:
+            class_doc = element.existing_doc
+        else:
+            class_doc = (context.get("class_docs") or {}).get(element.parent)
+        return f"Class: {_first_line(class_doc)}" if class_doc else ""
 
     def _create_prompt(self, element: CodeElement, context: Dict[str, str]) -> str:
         """
@@ -351,21 +850,56 @@ Raises
         """
         # Add hierarchy context at the top
         hierarchy_context = self._get_hierarchy_context(element, context)
-        prompt = ""
+        parts: List[str] = []
         if hierarchy_context:
-            prompt += f"Hierarchy context:\n{hierarchy_context}\n\n"
-        prompt += f"Generate documentation for a {element.type.value} named '{element.name}'"
+            parts.append(f"Hierarchy context:\n{hierarchy_context}\n\n")
+        parts.append(f"Generate documentation for a {element.type.value} named '{element.name}'")
         if element.parent:
-            prompt += f" in class '{element.parent}'"
-        prompt += f"\nDocumentation style: {self.doc_style.value}"
+            parts.append(f" in class '{element.parent}'")
+        parts.append(f"\nDocumentation style: {self.doc_style.value}")
         if context.get("description"):
-            prompt += f"\nProject description: {context['description']}"
+            parts.append(f"\nProject description: {context['description']}")
         if context.get("architecture"):
-            prompt += f"\nArchitecture context: {context['architecture']}"
+            parts.append(f"\nArchitecture context: {context['architecture']}")
         if context.get("purpose"):
-            prompt += f"\nProject purpose: {context['purpose']}"
-        prompt += "\n\nPlease provide a clear and concise description of what this code element does, with at least one example of usage."
-        return prompt
+            parts.append(f"\nProject purpose: {context['purpose']}")
+        parts.append(
+            "\n\nPlease provide a clear and concise description of what this code element does, with at least one example of usage."
+        )
+        return "".join(parts)
+
+    def _create_batch_prompt(self, elements: List[CodeElement], context: Dict[str, str]) -> str:
+        """
+        Create a single prompt documenting several elements, one numbered section per element.
+        """
+        # Hierarchy rows common to every element (e.g. the package, or the module of
+        # elements from one file) are sent once instead of once per element
+        hierarchies = [self._get_hierarchy_context(element, context).splitlines() for element in elements]
+        shared = [row for row in hierarchies[0] if all(row in rows for rows in hierarchies[1:])]
+        parts: List[str] = []
+        if shared:
+            parts.append("Hierarchy context:\n" + "\n".join(shared) + "\n\n")
+        parts.append(f"Generate documentation for the following {len(elements)} code elements.")
+        parts.append(f"\nDocumentation style: {self.doc_style.value}")
+        if context.get("description"):
+            parts.append(f"\nProject description: {context['description']}")
+        if context.get("architecture"):
+            parts.append(f"\nArchitecture context: {context['architecture']}")
+        if context.get("purpose"):
+            parts.append(f"\nProject purpose: {context['purpose']}")
+        for number, (element, rows) in enumerate(zip(elements, hierarchies), start=1):
+            parts.append(f"\n\n### Element {number}: {element.type.value} '{element.name}'")
+            if element.parent:
+                parts.append(f" in class '{element.parent}'")
+            own_rows = [row for row in rows if row not in shared]
+            if own_rows:
+                parts.append("\n" + "\n".join(own_rows))
+        parts.append(
+            "\n\nFor each element, provide a clear and concise description of what it does, "
+            "with at least one example of usage. Respond only with a JSON array of the form "
+            '[{"id": 1, "doc": "..."}], using the element numbers above as ids.'
+        )
+        return "".join(parts)
 
     def _format_doc(self, template: str, content: str, element: CodeElement, context: Dict[str, str]) -> str:
         """
@@ -381,42 +915,23 @@ Raises
             str: The formatted documentation string.
         """
         # Basic formatting
-        format_args = {
-            "description": content,
-            "project_name": context.get("name", "the project"),
-            "architecture_context": context.get("architecture", ""),
-            "module_name": element.name if element.type == ElementType.MODULE else "",
-            "class_name": element.name if element.type == ElementType.CLASS else "",
-            "function_name": (element.name if element.type == ElementType.FUNCTION else ""),
-            "method_name": element.name if element.type == ElementType.METHOD else "",
-            "args": "",  # These would be extracted from the code
-            "returns": "",
-            "raises": "",
-            "attributes": "",
-            "methods": "",
-            "properties": "",
-            "params": "",
-            "throws": "",
-        }
+        format_args = _BLANK_FORMAT_ARGS.copy()
+        format_args["description"] = content
+        format_args["project_name"] = context.get("name", "the project")
+        format_args["architecture_context"] = context.get("architecture", "")
+        format_args[_NAME_FIELDS[element.type]] = element.name
 
         # Add parent class context for methods
         if element.type == ElementType.METHOD and element.parent:
             format_args["description"] = f"{content}\n\nPart of class: {element.parent}"
 
+        # Add class name to description for Google style class elements
+        if self.doc_style == DocStyle.GOOGLE and element.type == ElementType.CLASS:
+            format_args["description"] = f"Class {element.name}\n\n{content}"
+
         try:
-            # For Google style, ensure proper docstring formatting
-            if self.doc_style == DocStyle.GOOGLE:
-                # Add class name to description for class elements
-                if element.type == ElementType.CLASS:
-                    format_args["description"] = f"Class {element.name}\n\n{content}"
-                doc = template.format(**format_args)
-                if not doc.startswith('"""'):
-                    doc = '"""\n' + doc
-                if not doc.endswith('"""'):
-                    doc = doc + '\n"""'
-            else:
-                doc = template.format(**format_args)
-            return doc.strip()
+            # Templates are complete docstrings, Google ones quoted already
+            return _compile_template(template)(format_args).strip()
         except KeyError as e:
             print(f"Error formatting documentation: {e}")
             return content
@@ -4,14 +4,27 @@ Documentation parsing and generation for Codantix.
 This module provides utilities for extracting project context from README files, traversing codebases, and representing code elements for documentation.
 """
 
+import hashlib
+import io
+import multiprocessing
+import os
+import pickle
 import re
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from codantix.config import LANGUAGE_EXTENSION_MAP, CodeElement
 from codantix.parsers import get_parser
 
 
+# README sections extracted as project context
+_DESCRIPTION_RE = re.compile(r"^# .*\n\n(.*?)(?=\n##|\Z)", re.DOTALL | re.MULTILINE)
+_ARCHITECTURE_RE = re.compile(r"## Architecture\n\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_PURPOSE_RE = re.compile(r"## Purpose\n\n(.*?)(?=\n##|\Z)", re.DOTALL)
+
+
 class ReadmeParser:
     """
     Parser for README.md files to extract project context.
@@ -21,7 +34,7 @@ class ReadmeParser:
         """
         Initialize the README parser.
         """
-        self.supported_extensions = {".md"}
+        self.supported_extensions = frozenset({".md"})
 
     def parse(self, readme_path: Path) -> Dict[str, str]:
         """
@@ -43,81 +56,319 @@ class ReadmeParser:
         context = {}
 
         # Extract description (everything between title and first section)
-        description_match = re.search(
-            r"^# .*\n\n(.*?)(?=\n##|\Z)", content, re.DOTALL | re.MULTILINE
-        )
+        description_match = _DESCRIPTION_RE.search(content)
         if description_match:
             context["description"] = description_match.group(1).strip()
 
         # Extract architecture
-        arch_match = re.search(
-            r"## Architecture\n\n(.*?)(?=\n##|\Z)", content, re.DOTALL
-        )
+        arch_match = _ARCHITECTURE_RE.search(content)
         if arch_match:
             context["architecture"] = arch_match.group(1).strip()
 
         # Extract purpose
-        purpose_match = re.search(r"## Purpose\n\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
+        purpose_match = _PURPOSE_RE.search(content)
         if purpose_match:
             context["purpose"] = purpose_match.group(1).strip()
 
         return context
 
 
+# Bump when parser output changes, so elements cached by older versions are discarded
+_PARSE_CACHE_VERSION = 1
+
+
+class ParseCache:
+    """
+    Persistent map from source files to the code elements parsed from them, stored as a pickle.
+
+    An entry is reused while the file's modification time and size are unchanged, or, when
+    they changed, while the BLAKE2 digest of its content is (e.g. after a checkout touched
+    the file without editing it).
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the cache, loading existing entries from ``path`` if present.
+
+        Args:
+            path (Path): Location of the pickle file.
+        """
+        self.path = Path(path)
+        # file path -> ((mtime_ns, size), content digest, elements)
+        self.entries: Dict[str, Tuple[Tuple[int, int], bytes, List[CodeElement]]] = self._load()
+        self.dirty = False
+
+    def _load(self):
+        """
+        Load entries from disk; a missing, corrupt or outdated file yields an empty cache.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                version, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return {}
+        return entries if version == _PARSE_CACHE_VERSION and isinstance(entries, dict) else {}
+
+    def get(self, file_path: Path) -> Tuple[Optional[List[CodeElement]], Optional[tuple]]:
+        """
+        Look up the elements of an unchanged file.
+
+        Args:
+            file_path (Path): The source file.
+
+        Returns:
+            tuple: ``(elements, stamp)``; ``elements`` is None on a miss, and ``stamp`` (the file's
+            ``(mtime_ns, size)`` and content digest) is what :meth:`set` needs to record a miss.
+        """
+        key = str(file_path)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[2], None
+        try:
+            with open(file_path, "rb") as f:
+                digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+        except OSError:
+            return None, None
+        if entry is not None and entry[1] == digest:
+            self.entries[key] = (stamp, digest, entry[2])
+            self.dirty = True
+            return entry[2], None
+        return None, (stamp, digest)
+
+    def set(self, file_path: Path, stamp: tuple, elements: List[CodeElement]) -> None:
+        """
+        Record the elements parsed from a file.
+
+        Args:
+            file_path (Path): The source file.
+            stamp (tuple): The stamp returned by :meth:`get` for the file.
+            elements (List[CodeElement]): The elements parsed from it.
+        """
+        self.entries[str(file_path)] = (stamp[0], stamp[1], elements)
+        self.dirty = True
+
+    def save(self) -> None:
+        """
+        Atomically write the cache to disk if it changed, dropping entries of deleted files.
+        """
+        if not self.dirty:
+            return
+        entries = {key: entry for key, entry in self.entries.items() if os.path.exists(key)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((_PARSE_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
 class CodebaseTraverser:
     """
     Traverses the codebase to find elements needing documentation.
     """
 
-    def __init__(self, languages: List[str]):
+    # Below this many files, parsing in a process pool costs more than it saves
+    parallel_min_files = 64
+
+    # Directories of tooling, dependencies and build output, never searched for sources
+    ignored_dirs = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv"})
+
+    def __init__(self, languages: List[str], cache_path: Optional[Path] = None):
         """
         Initialize the codebase traverser with config.
         Args:
             languages: List of languages to traverse.
+            cache_path: Optional file where parsed elements are cached between runs, so
+                unchanged files are not parsed again; see :class:`ParseCache`.
         """
         assert all(
             lang.lower() in LANGUAGE_EXTENSION_MAP for lang in languages
         ), f"Invalid language: {languages}. Must be one of: {LANGUAGE_EXTENSION_MAP.keys()}"
         self.languages = languages
-        self.supported_extensions = {
+        self.supported_extensions = frozenset(
             ext
             for lang in languages
-            for ext in LANGUAGE_EXTENSION_MAP.get(lang.lower(), set())
-        }
+            for ext in LANGUAGE_EXTENSION_MAP.get(lang.lower(), ())
+        )
+        self.cache = ParseCache(cache_path) if cache_path is not None else None
+
+    def find_files(self, path: Path) -> List[Path]:
+        """
+        Find the source files under a directory in the configured languages.
+
+        Args:
+            path (Path): Path to the root directory to search.
 
-    def traverse(self, path: Path) -> List[CodeElement]:
+        Returns:
+            List[Path]: Paths of the supported source files; empty if ``path`` does not exist.
+        """
+        # os.scandir returns file types with the directory listing, so unlike
+        # Path.rglob no extra stat call is needed per entry; ignored directories
+        # are pruned without being listed
+        files = []
+        stack = [str(path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignored_dirs:
+                            stack.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1] in self.supported_extensions
+                        and entry.is_file()
+                    ):
+                        files.append(Path(entry.path))
+        return files
+
+    def traverse(
+        self, path: Path, max_workers: Optional[int] = None
+    ) -> List[CodeElement]:
         """
         Traverse the codebase and find elements needing documentation.
 
         Args:
             path (Path): Path to the root directory to traverse.
+            max_workers (Optional[int]): Number of processes used to parse files;
+                see :meth:`traverse_files`.
 
         Returns:
             List[CodeElement]: List of code elements found in the codebase.
         """
-        if not path.exists():
-            return []
+        return self.traverse_files(self.find_files(path), max_workers)
+
+    def traverse_files(
+        self, files: List[Path], max_workers: Optional[int] = None
+    ) -> List[CodeElement]:
+        """
+        Find the elements needing documentation in the given files.
+
+        Args:
+            files (List[Path]): Source files to parse.
+            max_workers (Optional[int]): Number of processes used to parse files;
+                see :meth:`iter_elements`.
+
+        Returns:
+            List[CodeElement]: List of code elements found in the files.
+        """
+        return list(self.iter_elements(files, max_workers))
+
+    def iter_elements(
+        self, files: List[Path], max_workers: Optional[int] = None
+    ) -> Iterator[CodeElement]:
+        """
+        Yield the elements needing documentation in the given files, file by file.
 
-        elements = []
-        for file_path in path.rglob("*"):
-            if file_path.suffix in self.supported_extensions:
-                elements.extend(self._process_file_with_parser(file_path))
-        return elements
+        Elements of the first files are available while later files are still being parsed.
+        With a parse cache, files unchanged since they were cached are not parsed again.
+
+        Args:
+            files (List[Path]): Source files to parse.
+            max_workers (Optional[int]): Number of processes used to parse files.
+                Files are parsed serially when this is None or 1, or when there
+                are fewer than ``parallel_min_files`` files.
+
+        Yields:
+            CodeElement: The code elements found, in file order.
+        """
+        if self.cache is None:
+            for elements in self._parse_files(files, max_workers):
+                yield from elements
+            return
+        lookups = [self.cache.get(file_path) for file_path in files]
+        misses = [file_path for file_path, (elements, _) in zip(files, lookups) if elements is None]
+        parsed = self._parse_files(misses, max_workers)
+        for file_path, (elements, stamp) in zip(files, lookups):
+            if elements is None:
+                elements = next(parsed)
+                if stamp is not None:
+                    self.cache.set(file_path, stamp, elements)
+            yield from elements
+        self.cache.save()
+
+    def _parse_files(
+        self, files: List[Path], max_workers: Optional[int] = None
+    ) -> Iterator[List[CodeElement]]:
+        """
+        Parse files, yielding the elements of each file in order; see :meth:`iter_elements`.
+        """
+        if max_workers and max_workers > 1 and len(files) >= self.parallel_min_files:
+            # forkserver workers start from a clean interpreter instead of
+            # inheriting the parent's LangChain imports and open handles
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context(
+                "forkserver" if "forkserver" in methods else "spawn"
+            )
+            chunksize = max(1, len(files) // (max_workers * 4))
+            with ProcessPoolExecutor(max_workers, mp_context=context) as executor:
+                yield from executor.map(_process_file_worker, files, chunksize=chunksize)
+        else:
+            for file_path in files:
+                yield self._process_file_with_parser(file_path)
 
     def _process_file_with_parser(self, file_path: Path) -> List[CodeElement]:
         """
         Generic file processor using the appropriate parser for the file type.
         """
+        return _process_file_worker(file_path)
+
+
+def _read_source(file_path: Path) -> str:
+    """
+    Read a source file as text with "\n" line breaks.
+
+    Python files are decoded with the encoding their PEP 263 coding cookie or BOM declares,
+    other files as UTF-8; undecodable bytes are replaced.
+
+    Args:
+        file_path (Path): The file to read.
+
+    Returns:
+        str: The file content.
+    """
+    data = file_path.read_bytes()
+    encoding = "utf-8"
+    if file_path.suffix in LANGUAGE_EXTENSION_MAP["python"]:
         try:
-            with open(file_path, "r") as f:
-                content = f.read()
-                parser = get_parser(file_path)
-                if parser:
-                    elements = parser.parse_file(content, 1, len(content.splitlines()))
-                    for e in elements:
-                        e.file_path = file_path
-                    return elements
-        except Exception as e:
-            print(f"Error processing {file_path}: {e}")
-            return []
+            encoding = tokenize.detect_encoding(io.BytesIO(data).readline)[0]
+        except SyntaxError:
+            pass
+    content = data.decode(encoding, errors="replace")
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def _process_file_worker(file_path: Path) -> List[CodeElement]:
+    """
+    Parse one source file with the parser for its type.
+
+    Defined at module level so process pool workers receive only the file path,
+    not a pickled traverser.
+
+    Args:
+        file_path (Path): The file to parse.
+
+    Returns:
+        List[CodeElement]: The elements found; empty if the file type is unsupported
+        or the file cannot be parsed.
+    """
+    try:
+        parser = get_parser(file_path)
+        if parser:
+            content = _read_source(file_path)
+            line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+            elements = parser.parse_file(content, 1, line_count)
+            return [e._replace(file_path=file_path) for e in elements]
+    except Exception as e:
+        print(f"Error processing {file_path}: {e}")
         return []
+    return []
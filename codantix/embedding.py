@@ -4,15 +4,152 @@ Embedding and vector database management for Codantix.
 This module provides the EmbeddingManager class, which handles embedding generation and storage in a vector database using LangChain.
 Supports multiple providers (OpenAI, HuggingFace, Google) and vector DBs (Chroma, Qdrant, Milvus, Milvus Lite).
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
 from .config import Config
-from .utils import _check_pkg
+from .utils import RATE_LIMIT_ATTEMPTS, _backoff_delay, _check_pkg, _is_rate_limited
 
-from langchain_core.documents import Document
 import os
+import time
+import uuid
 
 _check_pkg("langchain_community")
 
+# HNSW settings for Chroma collections: index updates buffered in large batches so bulk
+# inserts do not rebuild and persist the index repeatedly. The distance is left at
+# Chroma's default, which existing collections were created with.
+CHROMA_COLLECTION_METADATA = {
+    "hnsw:batch_size": 10000,
+    "hnsw:sync_threshold": 10000,
+}
+
+# Milvus index storing vectors as int8 (scalar quantization), used when quantization is enabled
+MILVUS_QUANTIZED_INDEX_PARAMS = {"index_type": "IVF_SQ8", "metric_type": "L2", "params": {"nlist": 1024}}
+
+# Embedding clients shared by all managers of a process, by provider, model and batch size,
+# so local models are loaded and API connection pools are opened only once
+_EMBEDDING_CLIENTS: Dict[tuple, Any] = {}
+_EMBEDDING_CLIENTS_LOCK = threading.Lock()
+
+class EmbeddingCache:
+    """
+    SQLite-backed map from texts to their embedding vectors, stored as float32.
+
+    Keys are BLAKE2 digests of the text together with a namespace naming the provider and model,
+    so vectors of different models never mix. The cache may be shared between threads.
+    """
+
+    # Texts looked up per query, below SQLite's limit on query parameters
+    _LOOKUP_CHUNK = 500
+
+    def __init__(self, path: Path, namespace: str):
+        """
+        Open the cache, creating the database file if needed.
+
+        Args:
+            path (Path): The SQLite database file.
+            namespace (str): Identifies the embedding model, e.g. ``openai:text-embedding-3-large``.
+        """
+        import numpy as np
+
+        self._np = np
+        self.path = Path(path)
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.blake2b(f"{self.namespace}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+    def get_many(self, texts: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up the cached vectors of texts.
+
+        Args:
+            texts (List[str]): Distinct texts.
+
+        Returns:
+            Dict[str, List[float]]: Vectors of the texts found in the cache, by text.
+        """
+        np = self._np
+        found = {}
+        with self._lock:
+            for i in range(0, len(texts), self._LOOKUP_CHUNK):
+                by_key = {self._key(text): text for text in texts[i:i + self._LOOKUP_CHUNK]}
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM vectors WHERE key IN ({','.join('?' * len(by_key))})",
+                    list(by_key),
+                )
+                for key, blob in rows:
+                    found[by_key[key]] = np.frombuffer(blob, dtype=np.float32).tolist()
+        return found
+
+    def set_many(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """
+        Store the vectors of texts.
+
+        Args:
+            texts (List[str]): The embedded texts.
+            vectors (List[List[float]]): Their vectors, in the same order.
+        """
+        np = self._np
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vector) VALUES (?, ?)",
+                [
+                    (self._key(text), np.asarray(vector, dtype=np.float32).tobytes())
+                    for text, vector in zip(texts, vectors)
+                ],
+            )
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+def _embedding_text(text: str, metadata: Dict[str, Any]) -> str:
+    """
+    Text embedded for a documentation entry: the entry prefixed with the file and element it
+    documents, so entries sharing generic wording still embed close to their own code.
+
+    Args:
+        text (str): The documentation text.
+        metadata (Dict[str, Any]): The entry's metadata; entries without a file path are
+            embedded as they are.
+
+    Returns:
+        str: The text to embed.
+    """
+    file_path = metadata.get("file_path")
+    if not file_path:
+        return text
+    name = ".".join(filter(None, (metadata.get("parent"), metadata.get("element"))))
+    return f"{file_path}::{name}\n{text}"
+
+
+def _in_event_loop() -> bool:
+    """Whether the caller runs inside an event loop, where asyncio.run cannot be used."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 class EmbeddingManager:
     """
     Handles embedding generation and storage in a vector database using LangChain.
@@ -21,7 +158,9 @@ class EmbeddingManager:
     Vector DB-agnostic: supports Chroma (local), Qdrant (local/external), Milvus (external), Milvus Lite (embedded/local), and can be extended.
     """
     def __init__(self, embedding: str, provider: str, vector_db_type: str, dimensions: int, 
-                 collection_name: str, host: str, port: Optional[int] = None, persist_directory: Optional[str] = "vecdb/"):
+                 collection_name: str, host: str, port: Optional[int] = None, persist_directory: Optional[str] = "vecdb/",
+                 batch_size: int = 32, max_concurrency: int = 8, async_mode: bool = False,
+                 cache_path: Optional[Path] = None, quantize: bool = False):
         """
         Initialize the EmbeddingManager.
 
@@ -34,6 +173,14 @@ class EmbeddingManager:
             host: str, host name
             port: int, port number
             persist_directory: str, path to the vector database, default is "vecdb/"
+            batch_size: int, number of texts per embedding request, default is 32
+            max_concurrency: int, maximum number of concurrent embedding requests, default is 8
+            async_mode: bool, send concurrent requests through the provider's async API on an
+                event loop instead of from worker threads, default is False
+            cache_path: Path, optional SQLite file caching vectors by text, so texts embedded by
+                earlier runs are not sent to the provider again; see :class:`EmbeddingCache`
+            quantize: bool, have Qdrant and Milvus index the vectors as int8, a quarter of the
+                memory of float32 vectors; Chroma has no quantized index and ignores it, default is False
         """
         self.embedding_model = embedding
         self.provider = provider
@@ -43,6 +190,15 @@ class EmbeddingManager:
         self.host = host
         self.port = port
         self.persist_directory = persist_directory
+        self.batch_size = max(1, batch_size or 32)
+        self.max_concurrency = max(1, max_concurrency or 8)
+        self.async_mode = async_mode
+        self.quantize = quantize
+        self.cache = (
+            EmbeddingCache(cache_path, f"{provider}:{embedding}:{dimensions}")
+            if cache_path is not None
+            else None
+        )
         self.embeddings = self._init_embedding_function()
         self.db = self._init_vector_db()
 
@@ -50,6 +206,8 @@ class EmbeddingManager:
         """
         Initialize the embedding function based on provider and config.
 
+        Clients are shared between managers with the same provider, model and batch size.
+
         Returns:
             Embedding function instance compatible with LangChain.
 
@@ -58,10 +216,23 @@ class EmbeddingManager:
             ValueError: If required API keys are not set in the environment.
             NotImplementedError: If the provider is not supported.
         """
+        key = (self.provider, self.embedding_model, self.batch_size)
+        with _EMBEDDING_CLIENTS_LOCK:
+            client = _EMBEDDING_CLIENTS.get(key)
+            if client is None:
+                client = _EMBEDDING_CLIENTS[key] = self._create_embedding_function()
+        return client
+
+    def _create_embedding_function(self):
+        """
+        Create a new embedding function for the provider; see :meth:`_init_embedding_function`.
+        """
         if self.provider == "huggingface":
             _check_pkg("langchain_huggingface")
             from langchain_huggingface import HuggingFaceEmbeddings
-            return HuggingFaceEmbeddings(model_name=self.embedding_model)
+            return HuggingFaceEmbeddings(
+                model_name=self.embedding_model, encode_kwargs={"batch_size": self.batch_size}
+            )
         elif self.provider == "openai":
             _check_pkg("langchain_openai")
             from langchain_openai import OpenAIEmbeddings
@@ -94,7 +265,8 @@ class EmbeddingManager:
             return Chroma(
                 persist_directory=self.persist_directory,
                 embedding_function=self.embeddings,
-                collection_name=self.collection_name
+                collection_name=self.collection_name,
+                collection_metadata=CHROMA_COLLECTION_METADATA,
             )
         elif self.vector_db_type == "qdrant":
             from qdrant_client import QdrantClient
@@ -110,6 +282,8 @@ class EmbeddingManager:
                     port=self.port,
                     api_key=os.getenv("QDRANT_API_KEY"),
                 )
+            if self.quantize:
+                self._quantize_qdrant_collection(client)
 
             return QdrantVectorStore(
                 client=client,
@@ -129,42 +303,237 @@ class EmbeddingManager:
                     "password": os.getenv("MILVUS_PASSWORD"),
                     "uri": f"http://{self.host}:{self.port}",
                 },
+                index_params=MILVUS_QUANTIZED_INDEX_PARAMS if self.quantize else None,
             )
         else:
             raise NotImplementedError(f"Vector DB type '{self.vector_db_type}' not yet supported.")
 
+    def _quantize_qdrant_collection(self, client):
+        """
+        Enable int8 scalar quantization on the Qdrant collection, creating it if needed.
+
+        Qdrant searches the int8 vectors and rescores the best matches with the original ones.
+        A new collection is sized from a vector of the embedding model, so it matches the
+        vectors actually stored, and uses the cosine distance QdrantVectorStore defaults to.
+
+        Args:
+            client: The Qdrant client holding the collection.
+        """
+        from qdrant_client import models
+
+        quantization = models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8, always_ram=True)
+        )
+        if client.collection_exists(self.collection_name):
+            client.update_collection(self.collection_name, quantization_config=quantization)
+        else:
+            client.create_collection(
+                self.collection_name,
+                vectors_config=models.VectorParams(
+                    size=len(self.embeddings.embed_query("dimensions")),
+                    distance=models.Distance.COSINE,
+                ),
+                quantization_config=quantization,
+            )
+
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for a list of texts using the configured model/provider.
 
+        Texts are sent ``batch_size`` at a time. A request rejected with a rate-limit error is
+        retried with exponential backoff, without resending the batches already embedded.
+
         Args:
             texts (List[str]): List of text strings to embed.
 
         Returns:
             List[List[float]]: List of embedding vectors.
         """
-        return self.embeddings.embed_documents(texts)
+        vectors = []
+        for i in range(0, len(texts), self.batch_size):
+            vectors.extend(self._embed_batch(texts[i:i + self.batch_size]))
+        return vectors
+
+    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed one batch of texts, retrying rate-limit errors with backoff.
+        """
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            try:
+                return self.embeddings.embed_documents(texts)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+
+    async def agenerate_embeddings(self, texts: List[str], batch_size: Optional[int] = None,
+                                   max_concurrency: Optional[int] = None) -> List[List[float]]:
+        """
+        Asynchronously generate embeddings, with up to ``max_concurrency`` batches in flight.
+
+        Args:
+            texts (List[str]): List of text strings to embed.
+            batch_size (Optional[int]): Number of texts per embedding request; defaults to the
+                manager's ``batch_size``.
+            max_concurrency (Optional[int]): Maximum number of concurrent embedding requests;
+                defaults to the manager's ``max_concurrency``.
+
+        Returns:
+            List[List[float]]: Embedding vectors, in the same order as ``texts``.
+        """
+        batch_size = batch_size or self.batch_size
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+        async def run(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._aembed_batch(batch)
+
+        results = await asyncio.gather(
+            *(run(texts[i:i + batch_size]) for i in range(0, len(texts), batch_size))
+        )
+        return [vector for batch_vectors in results for vector in batch_vectors]
+
+    async def _aembed_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Asynchronously embed one batch of texts, retrying rate-limit errors with backoff.
+        """
+        for attempt in range(RATE_LIMIT_ATTEMPTS):
+            try:
+                return await self.embeddings.aembed_documents(texts)
+            except Exception as e:
+                if not _is_rate_limited(e) or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+
+    def embed_texts(self, texts: List[str], batch_size: Optional[int] = None,
+                    max_workers: Optional[int] = None) -> List[List[float]]:
+        """
+        Embed texts in batches, sending up to ``max_workers`` batches to the provider at once.
 
-    def store_embeddings(self, texts: List[str], metadatas: List[Dict[str, Any]]):
+        In async mode, and when not called from a running event loop, the batches are sent
+        through :meth:`agenerate_embeddings`; otherwise from a thread pool.
+
+        Identical texts (such as boilerplate docs, or empty docs of undocumented elements) are
+        embedded once and share the resulting vector. With an embedding cache, only texts it
+        does not hold are sent to the provider, and their vectors are added to it.
+
+        Args:
+            texts (List[str]): List of text strings to embed.
+            batch_size (Optional[int]): Number of texts per embedding request; defaults to the
+                manager's ``batch_size``.
+            max_workers (Optional[int]): Maximum number of concurrent embedding requests; defaults
+                to the manager's ``max_concurrency``.
+
+        Returns:
+            List[List[float]]: Embedding vectors, in the same order as ``texts``.
+        """
+        batch_size = batch_size or self.batch_size
+        max_workers = max_workers or self.max_concurrency
+        unique = list(dict.fromkeys(texts))
+        cached = self.cache.get_many(unique) if self.cache is not None else {}
+        misses = [text for text in unique if text not in cached] if cached else unique
+        batches = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+        if len(batches) <= 1:
+            vectors = self.generate_embeddings(misses) if misses else []
+        elif self.async_mode and not _in_event_loop():
+            vectors = asyncio.run(self.agenerate_embeddings(misses, batch_size, max_workers))
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                results = executor.map(self.generate_embeddings, batches)
+                vectors = [vector for batch_vectors in results for vector in batch_vectors]
+        if self.cache is not None and misses:
+            self.cache.set_many(misses, vectors)
+        if not cached and len(unique) == len(texts):
+            return vectors
+        by_text = dict(zip(misses, vectors))
+        by_text.update(cached)
+        return [by_text[text] for text in texts]
+
+    def store_embeddings(self, texts: List[str], metadatas: List[Dict[str, Any]],
+                         embeddings: Optional[List[List[float]]] = None, ids: Optional[List[str]] = None,
+                         persist: bool = True):
         """
         Store texts and their metadata in the configured vector database.
 
         Args:
             texts (List[str]): List of text strings to store.
             metadatas (List[Dict[str, Any]]): List of metadata dictionaries for each text.
+            embeddings (Optional[List[List[float]]]): Precomputed vectors for ``texts``. When omitted,
+                the vector database embeds the texts itself.
+            ids (Optional[List[str]]): UUIDs of the entries. Entries already stored under the same
+                id are replaced; when omitted, random ids are assigned.
+            persist (bool): Persist the database after the write. Callers writing several
+                batches pass False and call :meth:`flush` once at the end.
+        """
+        id_kwargs = {"ids": ids} if ids is not None else {}
+        if embeddings is not None and self.vector_db_type == "chroma" and all(metadatas):
+            import numpy as np
+
+            # LangChain's Chroma wrapper has no public way to add precomputed vectors.
+            # Chroma stores float32, so converting up front halves the payload
+            # compared to lists of Python floats.
+            self.db._collection.upsert(
+                ids=ids or [str(uuid.uuid4()) for _ in texts],
+                embeddings=np.asarray(embeddings, dtype=np.float32),
+                metadatas=metadatas,
+                documents=texts,
+            )
+        elif embeddings is not None and hasattr(self.db, "add_embeddings"):
+            self.db.add_embeddings(texts=texts, embeddings=embeddings, metadatas=metadatas, **id_kwargs)
+        else:
+            # add_documents only unpacks Documents back into texts and metadatas
+            self.db.add_texts(texts, metadatas=metadatas, **id_kwargs)
+        if persist:
+            self.flush()
+
+    def flush(self):
+        """
+        Persist the vector database, for clients that do not write through to disk.
         """
-        docs = [Document(page_content=text, metadata=meta) for text, meta in zip(texts, metadatas)]
-        self.db.add_documents(docs)
         if hasattr(self.db, "persist"):
             self.db.persist()
 
-    def update_database(self, docs: List[Dict[str, Any]]):
+    def get_metadatas(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Get the metadata of all entries stored for a source file.
+
+        Only Chroma supports metadata lookups; other vector DBs return an empty list.
+
+        Args:
+            file_path (str): The source file path recorded in the entries' metadata.
+
+        Returns:
+            List[Dict[str, Any]]: Metadata dictionaries of the matching entries.
+        """
+        if self.vector_db_type != "chroma":
+            return []
+        result = self.db.get(where={"file_path": file_path}, include=["metadatas"])
+        return result.get("metadatas") or []
+
+    def update_database(self, docs: Iterable[Dict[str, Any]], batch_size: int = 256):
         """
-        Generate and store embeddings for a batch of documentation entries.
+        Generate and store embeddings for documentation entries.
+
+        Entries are consumed lazily and written ``batch_size`` at a time, so ``docs`` may be a
+        generator producing more entries than fit in memory. The database is persisted once,
+        after the last batch. Each text is embedded prefixed with its file path and element name,
+        while the stored text is left unchanged.
 
         Args:
-            docs (List[Dict[str, Any]]): List of documentation entries, each with a 'text' field and metadata.
+            docs (Iterable[Dict[str, Any]]): Documentation entries, each with a 'text' field, metadata
+                and optionally an 'id' replacing any entry stored under the same id.
+            batch_size (int): Number of entries embedded and stored per batch.
         """
-        texts = [doc["text"] for doc in docs]
-        metadatas = [doc.get("metadata", {}) for doc in docs]
-        self.store_embeddings(texts, metadatas) 
\ No newline at end of file
+        docs = iter(docs)
+        while batch := list(islice(docs, batch_size)):
+            if all("id" in doc for doc in batch):
+                # Ids must be unique within a write; the last entry for an id wins
+                batch = list({doc["id"]: doc for doc in batch}.values())
+                ids = [doc["id"] for doc in batch]
+            else:
+                ids = None
+            texts = [doc["text"] for doc in batch]
+            metadatas = [doc.get("metadata", {}) for doc in batch]
+            embeddings = self.embed_texts([_embedding_text(t, m) for t, m in zip(texts, metadatas)])
+            self.store_embeddings(texts, metadatas, embeddings, ids, persist=False)
+        self.flush()
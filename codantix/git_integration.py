@@ -6,14 +6,21 @@ diffs, and content from a Git repository, supporting PR-based and
 incremental documentation workflows.
 """
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import git
 
+# Extensions of the source files whose changes are reported
+_SOURCE_SUFFIXES = (".py", ".js", ".java")
 
-@dataclass
+# Hunk header of a unified diff, capturing the start and length of the new-file range
+_HUNK_RE = re.compile(rb"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+
+@dataclass(frozen=True, slots=True)
 class FileChange:
     """
     Represents a file change in a commit.
@@ -21,9 +28,16 @@ class FileChange:
 
     file_path: Path
     change_type: str  # 'A' for added, 'M' for modified, 'D' for deleted
-    diff: str
+    patch: bytes  # Unified diff of the file, as git produced it
     hunks: List[Tuple[int, int]]  # List of (start_line, end_line) tuples
 
+    @property
+    def diff(self) -> str:
+        """
+        The unified diff of the file as text, decoded on access.
+        """
+        return self.patch.decode("utf-8", errors="replace")
+
 
 class GitIntegration:
     """
@@ -41,6 +55,28 @@ class GitIntegration:
         """
         self.repo_path = repo_path
         self.repo = git.Repo(repo_path)
+        # Commits looked up by this instance, by the revision they were requested with
+        self._commit_cache: Dict[str, git.Commit] = {}
+        # Decoded file contents by blob id, shared by every path and commit holding the same blob
+        self._blob_cache: Dict[bytes, str] = {}
+
+    def _commit(self, commit_sha: str) -> git.Commit:
+        """
+        Look up a commit, reusing the object (and its parsed tree) across calls.
+
+        Args:
+            commit_sha (str): The commit SHA or revision to resolve.
+
+        Returns:
+            git.Commit: The resolved commit.
+
+        Raises:
+            git.BadName: If the revision does not name a commit.
+        """
+        commit = self._commit_cache.get(commit_sha)
+        if commit is None:
+            commit = self._commit_cache[commit_sha] = self.repo.commit(commit_sha)
+        return commit
 
     def get_changed_files(self, commit_sha: str) -> List[FileChange]:
         """
@@ -53,24 +89,16 @@ class GitIntegration:
             List[FileChange]: List of file changes in the commit.
         """
         try:
-            commit = self.repo.commit(commit_sha)
+            commit = self._commit(commit_sha)
             parent = commit.parents[0] if commit.parents else None
 
             if not parent:
-                # If this is the first commit, consider all files as added
-                return [
-                    FileChange(
-                        file_path=Path(item.a_path),
-                        change_type="A",
-                        diff=str(item.diff),
-                        hunks=self._extract_hunks(str(item.diff)),
-                    )
-                    for item in commit.tree.traverse()
-                    if item.type == "blob"
-                ]
+                # If this is the first commit, consider all source files as added
+                return self._list_added_files(commit)
 
-            # Get diff between commit and its parent
-            diffs = parent.diff(commit)
+            # Diff the commit against its parent with patches, in a single git call. Without
+            # context lines, hunks cover only the lines actually changed.
+            diffs = parent.diff(commit, create_patch=True, unified=0)
             changes = []
 
             for diff in diffs:
@@ -81,18 +109,16 @@ class GitIntegration:
                     change_type = "D"
                     continue  # Skip deleted files for documentation
 
-                if diff.a_path and diff.a_path.endswith((".py", ".js", ".java")):
-                    # Get the diff content using GitPython's diff functionality
-                    diff_content = self.repo.git.diff(
-                        parent.hexsha, commit.hexsha, "--", diff.a_path
-                    )
-
+                # New files only have a b_path; renamed files are documented at their new path
+                path = diff.b_path or diff.a_path
+                if path and path.endswith(_SOURCE_SUFFIXES):
+                    # Hunks are read from the raw patch; it is only decoded if its text is used
                     changes.append(
                         FileChange(
-                            file_path=Path(diff.a_path),
+                            file_path=Path(path),
                             change_type=change_type,
-                            diff=diff_content,
-                            hunks=self._extract_hunks(diff_content),
+                            patch=diff.diff or b"",
+                            hunks=self._extract_hunks(diff.diff or b""),
                         )
                     )
 
@@ -102,53 +128,67 @@ class GitIntegration:
             print(f"Error getting changed files: {e}")
             return []
 
-    def _extract_hunks(self, diff: str) -> List[Tuple[int, int]]:
+    def _list_added_files(self, commit: git.Commit) -> List[FileChange]:
+        """
+        List the source files of a commit's tree as added files, for a commit without parent.
+
+        The tree is listed by a single ``git ls-tree`` call. Each file gets one hunk covering
+        the whole file: its size in bytes bounds its line count, so no blob is read.
+
+        Args:
+            commit (git.Commit): The commit whose tree to list.
+
+        Returns:
+            List[FileChange]: One added file change per source file.
+        """
+        listing = self.repo.git.ls_tree("-r", "-l", "-z", commit.hexsha)
+        changes = []
+        for entry in listing.split("\0"):
+            info, _, path = entry.partition("\t")
+            fields = info.split()
+            if len(fields) == 4 and fields[1] == "blob" and path.endswith(_SOURCE_SUFFIXES):
+                changes.append(
+                    FileChange(
+                        file_path=Path(path),
+                        change_type="A",
+                        patch=b"",
+                        hunks=[(1, max(int(fields[3]), 1))],
+                    )
+                )
+        return changes
+
+    def _extract_hunks(self, diff: Union[str, bytes]) -> List[Tuple[int, int]]:
         """
         Extract line number ranges from diff hunks.
 
+        Ranges are read from the hunk headers alone, so hunk bodies are never scanned.
+
         Args:
-            diff (str): The diff string to parse.
+            diff (Union[str, bytes]): The diff to parse.
 
         Returns:
             List[Tuple[int, int]]: List of (start_line, end_line) tuples
-            for each hunk.
+            for each hunk, covering the hunk's lines in the new file.
         """
+        if isinstance(diff, str):
+            diff = diff.encode("utf-8")
         hunks = []
-        current_hunk = None
-        current_start = None
-
-        for line in diff.split("\n"):
-            if line.startswith("@@"):
-                # Save previous hunk if exists
-                if current_hunk and current_start:
-                    hunks.append((current_start, current_hunk))
-
-                # Parse new hunk header
-                try:
-                    # Extract the line numbers from the hunk header
-                    # Format: @@ -a,b +c,d @@
-                    parts = line.split(" ")[1:3]
-                    if len(parts) == 2:
-                        new_line = int(parts[1].split(",")[0][1:])
-                        current_start = new_line
-                        current_hunk = new_line
-                except (IndexError, ValueError):
-                    continue
-            elif line.startswith("+") and current_hunk is not None:
-                current_hunk += 1
-            elif line.startswith("-") and current_hunk is not None:
-                current_hunk += 1
-
-        # Add the last hunk
-        if current_hunk and current_start:
-            hunks.append((current_start, current_hunk))
-
+        for match in _HUNK_RE.finditer(diff):
+            start = int(match.group(1))
+            if start:
+                # A missing length means one line; an empty range (pure deletion) is
+                # reported as the line it follows
+                length = int(match.group(2) or 1)
+                hunks.append((start, start + max(length, 1) - 1))
         return hunks
 
     def get_file_content(self, file_path: Path, commit_sha: str) -> Optional[str]:
         """
         Get the content of a file at a specific commit.
 
+        Each blob is read and decoded once; later requests for the same content, at any path
+        or commit, reuse it.
+
         Args:
             file_path (Path): Path to the file.
             commit_sha (str): The commit SHA to retrieve the file from.
@@ -157,13 +197,33 @@ class GitIntegration:
             Optional[str]: File content as a string, or None if not found.
         """
         try:
-            commit = self.repo.commit(commit_sha)
+            commit = self._commit(commit_sha)
             blob = commit.tree[str(file_path)]
-            return blob.data_stream.read().decode("utf-8")
+            content = self._blob_cache.get(blob.binsha)
+            if content is None:
+                content = self._blob_cache[blob.binsha] = blob.data_stream.read().decode("utf-8")
+            return content
         except (git.GitCommandError, git.BadName, KeyError) as e:
             print(f"Error getting file content: {e}")
             return None
 
+    def get_parent_sha(self, commit_sha: str) -> Optional[str]:
+        """
+        Get the SHA of the first parent of a commit.
+
+        Args:
+            commit_sha (str): The commit SHA whose parent to retrieve.
+
+        Returns:
+            Optional[str]: Parent commit SHA, or None for a root commit or if not found.
+        """
+        try:
+            parents = self._commit(commit_sha).parents
+            return parents[0].hexsha if parents else None
+        except (git.GitCommandError, git.BadName) as e:
+            print(f"Error getting parent commit: {e}")
+            return None
+
     def get_commit_message(self, commit_sha: str) -> Optional[str]:
         """
         Get the commit message for a specific commit.
@@ -175,7 +235,7 @@ class GitIntegration:
             Optional[str]: Commit message string, or None if not found.
         """
         try:
-            commit = self.repo.commit(commit_sha)
+            commit = self._commit(commit_sha)
             return commit.message
         except (git.GitCommandError, git.BadName) as e:
             print(f"Error getting commit message: {e}")
@@ -192,11 +252,12 @@ class GitIntegration:
             Optional[str]: Branch name string, or None if not found.
         """
         try:
-            commit = self.repo.commit(commit_sha)
-            for branch in self.repo.heads:
-                if branch.commit == commit:
-                    return branch.name
-            return None
+            commit = self._commit(commit_sha)
+            # A single ref query instead of resolving the commit of every branch
+            names = self.repo.git.for_each_ref(
+                "--format=%(refname:short)", f"--points-at={commit.hexsha}", "refs/heads"
+            ).splitlines()
+            return names[0] if names else None
         except (git.GitCommandError, git.BadName) as e:
             print(f"Error getting branch name: {e}")
             return None
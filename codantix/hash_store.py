@@ -0,0 +1,129 @@
+"""
+Content hashing for incremental indexing in Codantix.
+
+This module provides the HashStore class, a small persistent map from keys to content hashes,
+used to skip documentation and embedding work for code that has not changed since the last run.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from codantix.utils import json_dumps, json_loads
+
+
+def content_hash(text: str) -> str:
+    """
+    Compute a short, stable hash of a piece of text.
+
+    Args:
+        text (str): The text to hash.
+
+    Returns:
+        str: Hex digest of the text.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_hash(path: Path, salt: str = "") -> str:
+    """
+    Compute the SHA-256 hash of a file's contents.
+
+    Args:
+        path (Path): The file to hash.
+        salt (str): Mixed into the hash, so that the same content hashes differently
+            under different settings.
+
+    Returns:
+        str: Hex digest of the salt and file contents.
+    """
+    digest = hashlib.sha256(salt.encode("utf-8") + b"\0")
+    with open(path, "rb") as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def element_key(file_path: str, element_type: str, name: str, parent: Optional[str] = None) -> str:
+    """
+    Build the key identifying a code element across runs.
+
+    Args:
+        file_path (str): Path of the file containing the element.
+        element_type (str): The element type value (e.g. "function").
+        name (str): The element name.
+        parent (Optional[str]): The enclosing class, if any.
+
+    Returns:
+        str: The element key.
+    """
+    return "::".join((file_path, element_type, parent or "", name))
+
+
+class HashStore:
+    """
+    Persistent mapping of keys to content hashes, stored as a JSON file.
+
+    Usage:
+        store = HashStore(Path(".codantix/hashes.json"))
+        if store.get(key) != digest:
+            ...
+            store.set(key, digest)
+        store.save()
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize the store, loading existing hashes from ``path`` if present.
+
+        Args:
+            path (Path): Location of the JSON file.
+        """
+        self.path = Path(path)
+        self.hashes: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        """
+        Load hashes from disk; a missing or corrupt file yields an empty store.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                data = json_loads(f.read())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the stored hash for a key, or None if unknown.
+        """
+        return self.hashes.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Record the hash for a key.
+        """
+        self.hashes[key] = value
+
+    def keys(self) -> List[str]:
+        """
+        Get all keys with a stored hash.
+        """
+        return list(self.hashes)
+
+    def remove(self, key: str) -> None:
+        """
+        Forget the hash for a key, if any.
+        """
+        self.hashes.pop(key, None)
+
+    def save(self) -> None:
+        """
+        Atomically write the hashes to disk.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json_dumps(self.hashes))
+        os.replace(tmp_path, self.path)
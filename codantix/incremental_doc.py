@@ -5,19 +5,21 @@ This module provides the IncrementalDocumentation class for generating and updat
 Integrates with Git to detect changes and uses LLMs for doc generation.
 """
 
+import asyncio
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from codantix.config import CodeElement, LLMConfig
 from codantix.doc_generator import DocStyle, DocumentationGenerator
 from codantix.documentation import ReadmeParser
 from codantix.git_integration import GitIntegration
+from codantix.llm_cache import LLMCache, SemanticCache
 from codantix.parsers import get_parser
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DocumentationChange:
     """
     Represents a documentation change for a code element.
@@ -29,6 +31,28 @@ class DocumentationChange:
     change_type: str  # 'new', 'update', 'unchanged'
 
 
+def _line_span(element: CodeElement) -> Optional[Tuple[int, int]]:
+    """
+    First and last line of a code element, from its start line and source text.
+
+    Args:
+        element (CodeElement): The code element.
+
+    Returns:
+        Optional[Tuple[int, int]]: The span, or None if the element has no source.
+    """
+    if element.source is None:
+        return None
+    return element.line_number, element.line_number + element.source.count("\n")
+
+
+def _element_identity(element: CodeElement) -> Tuple:
+    """
+    Key identifying a code element within its file, across versions of the file.
+    """
+    return element.type, element.parent, element.name
+
+
 class IncrementalDocumentation:
     """
     Handles incremental documentation generation for code changes.
@@ -41,6 +65,10 @@ class IncrementalDocumentation:
         repo_path: Path,
         doc_style: DocStyle = DocStyle.GOOGLE,
         llm_config: LLMConfig = None,
+        llm_cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        batch_size: int = 8,
+        max_concurrency: int = 8,
     ):
         """
         Initialize incremental documentation generator.
@@ -49,18 +77,34 @@ class IncrementalDocumentation:
             repo_path (Path): Path to the repository root.
             doc_style (DocStyle): Documentation style to use.
             llm_config (LLMConfig): LLM configuration.
+            llm_cache (LLMCache, optional): Cache of earlier LLM answers.
+            semantic_cache (SemanticCache, optional): Cache of earlier LLM answers looked up by
+                prompt similarity.
+            batch_size (int): Maximum number of elements documented per LLM request.
+            max_concurrency (int): Maximum number of concurrent LLM requests.
         """
         self.name = name
         self.repo_path = repo_path
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        # Project context by commit, so the README is parsed once per commit
+        self._context_cache: Dict[str, Dict] = {}
         self.git_integration = GitIntegration(repo_path)
         self.doc_generator = DocumentationGenerator(
-            doc_style=doc_style, llm_config=llm_config
+            doc_style=doc_style,
+            llm_config=llm_config,
+            cache=llm_cache,
+            semantic_cache=semantic_cache,
         )
 
     def process_commit(self, commit_sha: str) -> List[DocumentationChange]:
         """
         Process a commit and generate documentation changes.
 
+        The changed elements of all files are collected first, then documented together in
+        batched, concurrent LLM requests. Documented elements of a modified file whose source is
+        the same as in the parent commit keep their documentation without an LLM request.
+
         Args:
             commit_sha (str): The commit SHA to process.
 
@@ -68,6 +112,10 @@ class IncrementalDocumentation:
             List[DocumentationChange]: List of documentation changes for the commit.
         """
         changes = []
+        # Changed elements of added or modified files, in order, with their documentation when
+        # it is kept as is; the others are documented once all files are read
+        selected: List[Tuple[CodeElement, Optional[str]]] = []
+        parent_sha = None
         file_changes = self.git_integration.get_changed_files(commit_sha)
 
         for file_change in file_changes:
@@ -113,45 +161,114 @@ class IncrementalDocumentation:
                     # Skip unsupported file types
                     continue
 
-                # Process each hunk in the file
-                for start_line, end_line in file_change.hunks:
-                    # Extract code elements in the changed lines
-                    elements = parser.parse_file(content, start_line, end_line)
-
-                    # Set file path for each element
-                    for element in elements:
-                        element.file_path = file_change.file_path
-
-                    for element in elements:
-                        # Get existing documentation if any
-                        old_doc = element.docstring
-
-                        # Generate new documentation
-                        new_doc = self.doc_generator.generate_doc(
-                            element, self._get_project_context(commit_sha)
-                        )
-
-                        # Determine change type
-                        change_type = "new"
-                        if old_doc:
-                            change_type = (
-                                "update" if old_doc != new_doc else "unchanged"
-                            )
+                # Parse the file once, then pick the elements of each hunk by line span
+                elements = [
+                    (element._replace(file_path=file_change.file_path), _line_span(element))
+                    for element in parser.parse_file(content, 1, len(content.splitlines()))
+                ]
 
-                        changes.append(
-                            DocumentationChange(
-                                element=element,
-                                old_doc=old_doc,
-                                new_doc=new_doc,
-                                change_type=change_type,
-                            )
-                        )
+                # Take each element touched by any hunk once, however many hunks touch it;
+                # elements without source cannot be located and are always included
+                hunks = file_change.hunks
+                changed = [
+                    element
+                    for element, span in elements
+                    if hunks
+                    and (span is None or any(span[0] <= end and span[1] >= start for start, end in hunks))
+                ]
+                # Only documented elements can keep their documentation, so the parent
+                # version is parsed only if there are any
+                previous = {}
+                if file_change.change_type == "M" and any(
+                    element.docstring and element.source is not None for element in changed
+                ):
+                    parent_sha = parent_sha or self.git_integration.get_parent_sha(commit_sha)
+                    if parent_sha:
+                        previous = self._element_sources(file_change.file_path, parent_sha, parser)
+                for element in changed:
+                    unchanged = (
+                        element.docstring
+                        and element.source is not None
+                        and previous.get(_element_identity(element)) == element.source
+                    )
+                    selected.append((element, element.docstring if unchanged else None))
+
+        pending = [element for element, kept_doc in selected if kept_doc is None]
+        new_docs = iter(
+            asyncio.run(self._agenerate_docs(pending, self._get_project_context(commit_sha)))
+            if pending
+            else ()
+        )
+        for element, kept_doc in selected:
+            new_doc = kept_doc if kept_doc is not None else next(new_docs)
+            # Get existing documentation if any
+            old_doc = element.docstring
+
+            # Determine change type
+            change_type = "new"
+            if old_doc:
+                change_type = "update" if old_doc != new_doc else "unchanged"
+
+            changes.append(
+                DocumentationChange(
+                    element=element,
+                    old_doc=old_doc,
+                    new_doc=new_doc,
+                    change_type=change_type,
+                )
+            )
 
         return changes
 
+    def _element_sources(self, file_path: Path, commit_sha: str, parser) -> Dict[Tuple, str]:
+        """
+        Source of each element of a file at a commit, by element identity.
+
+        Args:
+            file_path (Path): Path of the file.
+            commit_sha (str): The commit to read the file from.
+            parser (BaseParser): Parser for the file type.
+
+        Returns:
+            Dict[Tuple, str]: Element sources; empty if the file did not exist.
+        """
+        content = self.git_integration.get_file_content(file_path, commit_sha)
+        if not content:
+            return {}
+        return {
+            _element_identity(element): element.source
+            for element in parser.parse_file(content, 1, len(content.splitlines()))
+            if element.source is not None
+        }
+
+    async def _agenerate_docs(self, elements: List[CodeElement], context: Dict) -> List[str]:
+        """
+        Document elements in batches of ``batch_size``, with up to ``max_concurrency`` requests in flight.
+
+        Args:
+            elements (List[CodeElement]): The code elements to document.
+            context (Dict): Project context for documentation.
+
+        Returns:
+            List[str]: The generated documentation, in the same order as ``elements``.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: List[CodeElement]) -> List[str]:
+            async with semaphore:
+                return await self.doc_generator.agenerate_docs_batch(batch, context, self.batch_size)
+
+        results = await asyncio.gather(
+            *(
+                run(elements[i : i + self.batch_size])
+                for i in range(0, len(elements), self.batch_size)
+            )
+        )
+        return [doc for docs in results for doc in docs]
+
     def _get_project_context(self, commit_sha: str) -> Dict:
         """
-        Get project context for documentation generation.
+        Get project context for documentation generation, computed once per commit.
 
         Args:
             commit_sha (str): The commit SHA for which to extract context.
@@ -159,6 +276,10 @@ class IncrementalDocumentation:
         Returns:
             Dict: Project context dictionary (e.g., name, description, architecture).
         """
+        context = self._context_cache.get(commit_sha)
+        if context is not None:
+            return context
+
         # Use project name from self.config if available, else fallback to directory name
         project_name = self.name or os.path.basename(os.path.abspath(self.repo_path))
 
@@ -166,4 +287,5 @@ class IncrementalDocumentation:
         readme_path = Path(self.repo_path) / "README.md"
         context = ReadmeParser().parse(readme_path)
         context["name"] = project_name
+        self._context_cache[commit_sha] = context
         return context
@@ -0,0 +1,286 @@
+"""
+Persistent LLM response cache for Codantix.
+
+This module provides the LLMCache class, an exact-match cache of LLM answers stored in SQLite and
+keyed by a SHA-256 of the request, so re-running Codantix over prompts it has already sent returns
+the earlier answers instead of calling the LLM again. The optional SemanticCache also answers
+prompts that are nearly identical to earlier ones, such as the same element after a small edit
+to its hierarchy context.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from codantix.utils import json_dumps
+
+
+def request_key(messages: List[Dict[str, str]], model: str, params: Dict[str, Any]) -> bytes:
+    """
+    Compute the cache key of an LLM request.
+
+    Args:
+        messages (List[Dict[str, str]]): The chat messages sent to the model.
+        model (str): The provider and model name.
+        params (Dict[str, Any]): Sampling parameters that change the answer (temperature, top_p, ...).
+            Credentials and transport options must not be included.
+
+    Returns:
+        bytes: SHA-256 digest of the request.
+    """
+    return hashlib.sha256(json_dumps({"messages": messages, "model": model, "params": params})).digest()
+
+
+class LLMCache:
+    """
+    SQLite-backed map from request keys to LLM answers.
+
+    Answers older than ``ttl_seconds`` are never returned. Expired answers, and the oldest answers
+    beyond ``max_entries``, are evicted when the cache is opened, so writes stay a single insert.
+    The cache may be shared between threads.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: Optional[int] = None, max_entries: int = 100_000):
+        """
+        Open the cache, creating the database file if needed.
+
+        Args:
+            path (Path): The SQLite database file.
+            ttl_seconds (Optional[int]): Maximum age of a usable answer; None keeps answers forever.
+            max_entries (int): Maximum number of answers kept.
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key BLOB PRIMARY KEY, value TEXT NOT NULL, model TEXT, created_at INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at)")
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Remove expired answers and the oldest answers beyond ``max_entries``.
+        """
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (int(time.time()) - self.ttl_seconds,)
+            )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached answer.
+
+        Args:
+            key (bytes): The request key (see :func:`request_key`).
+
+        Returns:
+            Optional[str]: The cached answer, or None if absent or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl_seconds is not None and created_at < time.time() - self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return value
+
+    def set(self, key: bytes, value: str, model: str = "") -> None:
+        """
+        Store an answer.
+
+        Args:
+            key (bytes): The request key (see :func:`request_key`).
+            value (str): The LLM answer.
+            model (str): The model that produced the answer.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, model, created_at) VALUES (?, ?, ?, ?)",
+                (key, value, model, int(time.time())),
+            )
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticCache:
+    """
+    SQLite-backed map from prompts to LLM answers, looked up by embedding similarity.
+
+    A lookup returns the answer of the most similar stored prompt sent to the same model, if the
+    cosine similarity of their embeddings reaches ``threshold``. Embeddings are kept normalized in
+    memory, so a lookup is one matrix product over the stored prompts of that model. When the
+    cache is opened, only the newest ``max_entries`` answers are kept. The cache may be shared
+    between threads.
+
+    Callers documenting several prompts embed them with one :meth:`embed` or :meth:`aembed`
+    call and pass the vectors to :meth:`lookup` and :meth:`set`, so each prompt is embedded once.
+    """
+
+    def __init__(self, path: Path, embeddings, threshold: float = 0.97, max_entries: int = 10_000):
+        """
+        Open the cache, creating the database file if needed.
+
+        Args:
+            path (Path): The SQLite database file; may be shared with an :class:`LLMCache`.
+            embeddings: LangChain embeddings model used to embed prompts.
+            threshold (float): Minimum cosine similarity for a stored answer to be returned.
+            max_entries (int): Maximum number of answers kept.
+        """
+        import numpy as np
+
+        self._np = np
+        self.path = Path(path)
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_responses ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, model TEXT NOT NULL, "
+            "vector BLOB NOT NULL, value TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "DELETE FROM semantic_responses WHERE id <= (SELECT MAX(id) FROM semantic_responses) - ?",
+            (max_entries,),
+        )
+        # Stored vectors and answers by (model, dimensions); matrices are stacked on first lookup
+        self._vectors: Dict[Tuple[str, int], List[Any]] = {}
+        self._values: Dict[Tuple[str, int], List[str]] = {}
+        self._matrices: Dict[Tuple[str, int], Any] = {}
+        for model, blob, value in self._conn.execute(
+            "SELECT model, vector, value FROM semantic_responses ORDER BY id"
+        ):
+            self._add(model, np.frombuffer(blob, dtype=np.float32), value)
+
+    def embed(self, prompts: List[str]) -> List[Any]:
+        """
+        Embed prompts as normalized float32 vectors, in a single embeddings request.
+
+        Args:
+            prompts (List[str]): The prompts to embed.
+
+        Returns:
+            List[Any]: One vector per prompt, in the same order.
+        """
+        return self._normalize(self.embeddings.embed_documents(prompts))
+
+    async def aembed(self, prompts: List[str]) -> List[Any]:
+        """
+        Asynchronous counterpart of :meth:`embed`, leaving the event loop free during the request.
+
+        Args:
+            prompts (List[str]): The prompts to embed.
+
+        Returns:
+            List[Any]: One vector per prompt, in the same order.
+        """
+        return self._normalize(await self.embeddings.aembed_documents(prompts))
+
+    def _normalize(self, embedded: List[List[float]]) -> List[Any]:
+        """
+        Convert embeddings to float32 vectors of unit length.
+        """
+        np = self._np
+        vectors = []
+        for values in embedded:
+            vector = np.asarray(values, dtype=np.float32)
+            norm = np.linalg.norm(vector)
+            vectors.append(vector / norm if norm else vector)
+        return vectors
+
+    def _add(self, model: str, vector, value: str) -> None:
+        """
+        Add a stored answer to the in-memory index.
+        """
+        group = (model, len(vector))
+        self._vectors.setdefault(group, []).append(vector)
+        self._values.setdefault(group, []).append(value)
+        self._matrices.pop(group, None)
+
+    def get(self, prompt: str, model: str = "") -> Optional[str]:
+        """
+        Look up the answer of the most similar stored prompt.
+
+        Args:
+            prompt (str): The prompt about to be sent.
+            model (str): The model it would be sent to.
+
+        Returns:
+            Optional[str]: The cached answer, or None if no stored prompt is similar enough.
+        """
+        return self.lookup(self.embed([prompt])[0], model)
+
+    def lookup(self, vector, model: str = "") -> Optional[str]:
+        """
+        Look up the answer of the stored prompt most similar to an embedded prompt.
+
+        Args:
+            vector: The prompt's vector, as returned by :meth:`embed`.
+            model (str): The model it would be sent to.
+
+        Returns:
+            Optional[str]: The cached answer, or None if no stored prompt is similar enough.
+        """
+        group = (model, len(vector))
+        with self._lock:
+            if group not in self._vectors:
+                return None
+            matrix = self._matrices.get(group)
+            if matrix is None:
+                matrix = self._matrices[group] = self._np.vstack(self._vectors[group])
+            scores = matrix @ vector
+            best = int(scores.argmax())
+            if scores[best] < self.threshold:
+                return None
+            return self._values[group][best]
+
+    def set(self, prompt: str, value: str, model: str = "", vector=None) -> None:
+        """
+        Store an answer.
+
+        Args:
+            prompt (str): The prompt that was sent.
+            value (str): The LLM answer.
+            model (str): The model that produced the answer.
+            vector (optional): The prompt's vector, if already embedded by :meth:`embed`.
+        """
+        if vector is None:
+            vector = self.embed([prompt])[0]
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO semantic_responses (model, vector, value) VALUES (?, ?, ?)",
+                (model, vector.tobytes(), value),
+            )
+            self._add(model, vector, value)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
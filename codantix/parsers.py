@@ -9,7 +9,7 @@ import ast
 import esprima
 import logging
 import re
-from codantix.config import LANGUAGE_EXTENSION_MAP, CodeElement, ElementType
+from codantix.config import EXTENSION_LANGUAGE_MAP, LANGUAGE_EXTENSION_MAP, CodeElement, ElementType
 
 
 class BaseParser:
@@ -60,7 +60,7 @@ class PythonParser(BaseParser):
         Initialize Python parser.
         """
         super().__init__()
-        self.supported_extensions = ['.py']
+        self.supported_extensions = sorted(LANGUAGE_EXTENSION_MAP['python'])
 
     def parse_file(self, content: str, start_line: int, end_line: int) -> List[CodeElement]:
         """
@@ -75,6 +75,8 @@ class PythonParser(BaseParser):
             List[CodeElement]: List of code elements found in the file.
         """
         elements = []
+        if _has_no_python_elements(content):
+            return elements
         try:
             tree = ast.parse(content)
             # Module docstring
@@ -84,43 +86,12 @@ class PythonParser(BaseParser):
                     type=ElementType.MODULE,
                     file_path=Path(""),
                     line_number=1,
-                    docstring=tree.body[0].value.value
+                    docstring=tree.body[0].value.value,
+                    source=content
                 ))
-            # Helper to walk with parent context
-            def visit(node, parent_class=None):
-                if isinstance(node, ast.ClassDef):
-                    elements.append(CodeElement(
-                        name=node.name,
-                        type=ElementType.CLASS,
-                        file_path=Path(""),
-                        line_number=node.lineno,
-                        docstring=self._get_docstring(node)
-                    ))
-                    for item in node.body:
-                        visit(item, parent_class=node.name)
-                elif isinstance(node, ast.FunctionDef):
-                    if parent_class:
-                        elements.append(CodeElement(
-                            name=node.name,
-                            type=ElementType.METHOD,
-                            file_path=Path(""),
-                            line_number=node.lineno,
-                            docstring=self._get_docstring(node),
-                            parent=parent_class
-                        ))
-                    else:
-                        elements.append(CodeElement(
-                            name=node.name,
-                            type=ElementType.FUNCTION,
-                            file_path=Path(""),
-                            line_number=node.lineno,
-                            docstring=self._get_docstring(node)
-                        ))
-                # Recurse into other nodes that can contain classes/functions
-                elif hasattr(node, 'body') and isinstance(node.body, list):
-                    for item in node.body:
-                        visit(item, parent_class=parent_class)
-            visit(tree)
+            collector = _PythonElementCollector(self, content)
+            collector.visit(tree)
+            elements.extend(collector.elements)
         except SyntaxError:
             logging.warning("Syntax error encountered while parsing Python file. Returning empty element list.")
             pass
@@ -136,7 +107,7 @@ class PythonParser(BaseParser):
         Returns:
             Optional[str]: Extracted docstring, if found.
         """
-        if not isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
             return None
 
         if not node.body:
@@ -148,6 +119,97 @@ class PythonParser(BaseParser):
 
         return None
 
+# First token of a module when it is a plain name (e.g. ``import``), skipping blank and comment
+# lines; names directly followed by a quote are string prefixes and do not match
+_LEADING_NAME_RE = re.compile(r"(?:[ \t\f]*(?:#[^\r\n]*)?(?:\r\n|\r|\n))*[ \t\f]*([A-Za-z_]\w*)(?![\w'\"])")
+
+# Names that start a constant expression, which ``parse_file`` would report as a module docstring
+_CONSTANT_NAMES = frozenset({"None", "True", "False"})
+
+
+def _has_no_python_elements(content: str) -> bool:
+    """
+    Cheaply tell whether a module certainly defines no elements, so parsing can be skipped.
+
+    True when the source contains neither ``def`` nor ``class`` and does not start with a
+    constant that would be taken as the module docstring. A False result means nothing.
+    """
+    if "def" in content or "class" in content:
+        return False
+    match = _LEADING_NAME_RE.match(content)
+    return match is not None and match.group(1) not in _CONSTANT_NAMES
+
+
+# Zero-width split points after each line break, counted as the Python tokenizer counts lines
+_LINE_BREAK_RE = re.compile(r"(?<=\n)|(?<=\r)(?!\n)")
+
+
+class _PythonElementCollector(ast.NodeVisitor):
+    """
+    Collects the classes, functions and methods of a Python module in one pass.
+
+    Only statement bodies are descended into, so expressions and function bodies are never
+    visited. Source lines are split once per file rather than once per element, as
+    ``ast.get_source_segment`` would.
+    """
+
+    def __init__(self, parser: "PythonParser", content: str):
+        self.parser = parser
+        self.lines = _LINE_BREAK_RE.split(content)
+        self.elements: List[CodeElement] = []
+        # Name of the class whose body is being visited, if any
+        self.parent_class: Optional[str] = None
+
+    def source_segment(self, node: ast.AST) -> Optional[str]:
+        """
+        Source text of a node; same result as ``ast.get_source_segment(content, node)``.
+        """
+        end_lineno = getattr(node, "end_lineno", None)
+        end_col_offset = getattr(node, "end_col_offset", None)
+        if end_lineno is None or end_col_offset is None:
+            return None
+        lineno, col_offset = node.lineno - 1, node.col_offset
+        end_lineno -= 1
+        if lineno == end_lineno:
+            return self.lines[lineno].encode()[col_offset:end_col_offset].decode()
+        first = self.lines[lineno].encode()[col_offset:].decode()
+        last = self.lines[end_lineno].encode()[:end_col_offset].decode()
+        return "".join([first, *self.lines[lineno + 1:end_lineno], last])
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.elements.append(CodeElement(
+            name=node.name,
+            type=ElementType.CLASS,
+            file_path=Path(""),
+            line_number=node.lineno,
+            docstring=self.parser._get_docstring(node),
+            source=self.source_segment(node)
+        ))
+        outer, self.parent_class = self.parent_class, node.name
+        self.generic_visit(node)
+        self.parent_class = outer
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.elements.append(CodeElement(
+            name=node.name,
+            type=ElementType.METHOD if self.parent_class else ElementType.FUNCTION,
+            file_path=Path(""),
+            line_number=node.lineno,
+            docstring=self.parser._get_docstring(node),
+            parent=self.parent_class,
+            source=self.source_segment(node)
+        ))
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def generic_visit(self, node: ast.AST):
+        # Recurse into other nodes that can contain classes/functions
+        body = getattr(node, "body", None)
+        if isinstance(body, list):
+            for item in body:
+                self.visit(item)
+
+
 class JavaScriptParser(BaseParser):
     """
     Parser for JavaScript and TypeScript code.
@@ -158,7 +220,8 @@ class JavaScriptParser(BaseParser):
         Initialize JavaScript parser.
         """
         super().__init__()
-        self.supported_extensions = ['.js', '.jsx', '.ts', '.tsx']
+        self.supported_extensions = sorted(LANGUAGE_EXTENSION_MAP['javascript'])
+        self._source: Optional[str] = None
 
     def _get_jsdoc(self, node: Any, block_comments_by_end_line: dict = None, source_lines: list = None) -> Optional[str]:
         """
@@ -259,9 +322,11 @@ class JavaScriptParser(BaseParser):
                     element_type_enum = ElementType.METHOD
                 
                 if node_name and element_type_enum:
+                    node_range = getattr(node, 'range', None)
                     elements_list.append(CodeElement(
                         name=node_name, type=element_type_enum, file_path=file_path,
-                        line_number=current_node_line, docstring=docstring
+                        line_number=current_node_line, docstring=docstring,
+                        source=self._source[node_range[0]:node_range[1]] if node_range and self._source is not None else None
                     ))
         
         # Recursively traverse children based on node type
@@ -331,6 +396,7 @@ class JavaScriptParser(BaseParser):
             List[CodeElement]: List of code elements found in the file.
         """
         elements: List[CodeElement] = []
+        self._source = content
         try:
             tree = esprima.parseScript(content, {
                 'loc': True, 'comment': True, 'range': True, 
@@ -347,7 +413,8 @@ class JavaScriptParser(BaseParser):
                         elements.append(CodeElement(
                             name="module", type=ElementType.MODULE,
                             file_path=Path(""), line_number=1,
-                            docstring=self._clean_jsdoc(comment_obj.value)
+                            docstring=self._clean_jsdoc(comment_obj.value),
+                            source=content
                         ))
                         break # Found first top-level block comment at line 1
             
@@ -379,7 +446,7 @@ class JavaParser(BaseParser):
     """
     def __init__(self):
         super().__init__()
-        self.supported_extensions = ['.java']
+        self.supported_extensions = sorted(LANGUAGE_EXTENSION_MAP['java'])
 
     def _clean_javadoc(self, value: str) -> str:
         """
@@ -421,7 +488,8 @@ class JavaParser(BaseParser):
                 type=ElementType.CLASS,
                 file_path=Path(""),
                 line_number=line_number,
-                docstring=doc
+                docstring=doc,
+                source=match.group(0)
             ))
         # Find method definitions (very basic, public/protected/private returnType name(...))
         method_pattern = re.compile(r'^\s*(?:/\*\*([\s\S]*?)\*/\s*)?(public|protected|private|static|\s)+[\w<>\[\]]+\s+(\w+)\s*\([^)]*\)\s*\{', re.MULTILINE)
@@ -436,10 +504,20 @@ class JavaParser(BaseParser):
                 type=ElementType.METHOD,
                 file_path=Path(""),
                 line_number=line_number,
-                docstring=doc
+                docstring=doc,
+                source=match.group(0)
             ))
         return elements
 
+
+# Parser class for each supported language
+_LANGUAGE_PARSERS = {
+    'python': PythonParser,
+    'javascript': JavaScriptParser,
+    'java': JavaParser,
+}
+
+
 def get_parser(file_path: Path) -> Optional[BaseParser]:
     """
     Get appropriate parser for file type.
@@ -450,12 +528,6 @@ def get_parser(file_path: Path) -> Optional[BaseParser]:
     Returns:
         Optional[BaseParser]: Parser instance for the file type, or None if unsupported.
     """
-    extension = file_path.suffix.lower()
-    
-    if extension in LANGUAGE_EXTENSION_MAP['python']:
-        return PythonParser()
-    elif extension in LANGUAGE_EXTENSION_MAP['javascript']:
-        return JavaScriptParser()
-    elif extension in LANGUAGE_EXTENSION_MAP['java']:
-        return JavaParser()
-    return None 
\ No newline at end of file
+    parser_class = _LANGUAGE_PARSERS.get(EXTENSION_LANGUAGE_MAP.get(file_path.suffix.lower()))
+    return parser_class() if parser_class is not None else None
+ 
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""
+Long-running command server for Codantix.
+
+This module lets `codantix serve` keep a single process alive, so the LangChain imports, the embedding
+model and the vector database client are loaded once per session instead of once per command.
+CLI invocations forward their command to the server over a Unix socket, one JSON line per request
+and response, and fall back to running locally when no server is listening.
+"""
+
+import contextlib
+import io
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+
+from codantix.utils import json_dumps, json_loads
+
+# Socket of the server for a repository, relative to the repository root
+SOCKET_PATH = Path(".codantix") / "codantix.sock"
+
+# Set inside the server process, so commands it runs are not forwarded back to it
+serving = False
+
+
+def run_command(group: click.Group, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run a command of a click group in this process, capturing its output.
+
+    Args:
+        group (click.Group): The group the command belongs to.
+        name (str): The command name (e.g. "update-db").
+        params (Dict[str, Any]): Parameter values, keyed by parameter name.
+
+    Returns:
+        Dict[str, Any]: The command's ``exit_code``, ``stdout`` and ``stderr``.
+    """
+    with click.Context(group) as ctx:
+        command = group.get_command(ctx, name)
+    if command is None:
+        return {"exit_code": 2, "stdout": "", "stderr": f"Unknown command: {name}\n"}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            with click.Context(group) as ctx:
+                ctx.invoke(command, **params)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except click.exceptions.Exit as e:
+            exit_code = e.exit_code
+        except Exception as e:
+            stderr.write(f"Error: {e}\n")
+            exit_code = 1
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class _CommandHandler(socketserver.StreamRequestHandler):
+    """
+    Handles one forwarded command per connection.
+    """
+
+    def handle(self):
+        try:
+            request = json_loads(self.rfile.readline())
+            response = run_command(self.server.group, request["cmd"], request.get("params", {}))
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"exit_code": 2, "stdout": "", "stderr": f"Invalid request: {e}\n"}
+        self.wfile.write(json_dumps(response) + b"\n")
+
+
+def make_server(group: click.Group, socket_path: Path = SOCKET_PATH) -> socketserver.UnixStreamServer:
+    """
+    Create a server for the commands of a click group, bound to a Unix socket.
+
+    A stale socket left by a server that exited uncleanly is replaced.
+
+    Args:
+        group (click.Group): The group whose commands are served.
+        socket_path (Path): Where to create the socket.
+
+    Returns:
+        socketserver.UnixStreamServer: The bound server; requests are handled one at a time.
+
+    Raises:
+        RuntimeError: If another server is already listening on ``socket_path``.
+    """
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        sock = _connect(socket_path)
+        if sock is not None:
+            sock.close()
+            raise RuntimeError(f"A Codantix server is already running on {socket_path}")
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    server = socketserver.UnixStreamServer(str(socket_path), _CommandHandler)
+    server.group = group
+    return server
+
+
+def serve(group: click.Group, socket_path: Path = SOCKET_PATH) -> None:
+    """
+    Serve the commands of a click group on a Unix socket until interrupted.
+
+    Args:
+        group (click.Group): The group whose commands are served.
+        socket_path (Path): Where to create the socket.
+
+    Raises:
+        RuntimeError: If another server is already listening on ``socket_path``.
+    """
+    global serving
+    with make_server(group, socket_path) as server:
+        serving = True
+        try:
+            server.serve_forever()
+        finally:
+            serving = False
+            Path(socket_path).unlink(missing_ok=True)
+
+
+def _connect(socket_path: Path) -> Optional[socket.socket]:
+    """
+    Connect to a server socket, or return None if nobody is listening.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def forward(name: str, params: Dict[str, Any], socket_path: Path = SOCKET_PATH) -> Optional[Dict[str, Any]]:
+    """
+    Forward a command to a running server.
+
+    Args:
+        name (str): The command name.
+        params (Dict[str, Any]): JSON-serializable parameter values.
+        socket_path (Path): The server socket.
+
+    Returns:
+        Optional[Dict[str, Any]]: The server's response (see :func:`run_command`), or None if no
+        server is listening and the command should run locally.
+    """
+    if serving or not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    sock = _connect(Path(socket_path))
+    if sock is None:
+        return None
+    with sock:
+        sock.sendall(json_dumps({"cmd": name, "params": params}) + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        return {"exit_code": 1, "stdout": "", "stderr": "Codantix server closed the connection.\n"}
+    return json_loads(line)
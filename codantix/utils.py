@@ -1,10 +1,56 @@
-from typing import Optional
+import json
+import random
+from typing import Any, Optional, Union
 from importlib import util
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+# Attempts per provider request when the provider answers with a rate-limit error
+RATE_LIMIT_ATTEMPTS = 4
+
 
 def _check_pkg(pkg: str, *, pkg_kebab: Optional[str] = None) -> None:
     if not util.find_spec(pkg):
         pkg_kebab = pkg_kebab if pkg_kebab is not None else pkg.replace("_", "-")
         raise ImportError(
             f"Unable to import {pkg}. Please install with `pip install -U {pkg_kebab}`"
-        )
\ No newline at end of file
+        )
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool): Pretty-print with two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether a provider exception reports an exceeded rate limit."""
+    msg = str(error).lower()
+    return "rate limit" in msg or "429" in msg
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request, with jitter to spread out retries."""
+    return random.uniform(1, 4) * 2**attempt
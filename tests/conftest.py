@@ -1,3 +1,5 @@
+import json
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,6 +16,21 @@ class MockChatLLM:
     def __init__(self):
         self.calls = []
 
+    def _generate_docstring(self, elem_type, elem_name):
+        return f"Generated documentation for {elem_type} '{elem_name}'."
+
+    def answer(self, user_msg):
+        """Answer a documentation prompt: a JSON array for batched prompts, a docstring otherwise."""
+        batch = re.findall(r"### Element (\d+): (\w+) '([^']+)'", user_msg)
+        if batch:
+            return json.dumps(
+                [{"id": int(number), "doc": self._generate_docstring(elem_type, name)} for number, elem_type, name in batch]
+            )
+        m = re.search(r"for a (\w+) named '([^']+)'", user_msg)
+        elem_type = m.group(1).lower() if m else "element"
+        elem_name = m.group(2) if m else "unknown"
+        return self._generate_docstring(elem_type, elem_name)
+
     def invoke(self, messages, **kwargs):
         # Filter out unsupported parameters
         filtered_kwargs = {k: v for k, v in kwargs.items() if k in ["model", "temperature", "max_tokens", "stream"]}
@@ -78,21 +95,18 @@ def patch_llm(monkeypatch):
         from langchain_core.outputs import ChatGeneration, ChatResult
 
         # Create a mock LLM instance to generate the response
-        mock_llm = MockChatLLM()
         user_msg = next((m.content for m in messages if m.type == "human"), "")
-        import re
-
-        m = re.search(r"for a (\w+) named '([^']+)'", user_msg)
-        elem_type = m.group(1).lower() if m else "element"
-        elem_name = m.group(2) if m else "unknown"
-
-        doc = mock_llm._generate_docstring(elem_type, elem_name)
+        doc = MockChatLLM().answer(user_msg)
 
         return ChatResult(generations=[ChatGeneration(message=AIMessage(content=doc))])
 
-    # Patch both the old and new import paths
+    async def mock_agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        return mock_generate(self, messages, stop, **kwargs)
+
+    # Patch both the old and new import paths, and the sync and async generation paths
     monkeypatch.setattr("langchain.chat_models.init_chat_model", mock_init_llm)
     monkeypatch.setattr("langchain_openai.chat_models.ChatOpenAI._generate", mock_generate)
+    monkeypatch.setattr("langchain_openai.chat_models.ChatOpenAI._agenerate", mock_agenerate)
 
 
 @pytest.fixture(autouse=True)
@@ -103,6 +117,10 @@ def patch_openai_env(monkeypatch):
 @pytest.fixture(autouse=True)
 def mock_embedding_model():
     """Mock the embedding model to prevent downloading during tests."""
+    from codantix.embedding import _EMBEDDING_CLIENTS
+
+    # Clients are shared per process; each test gets one built from its own mock
+    _EMBEDDING_CLIENTS.clear()
     with patch("langchain_openai.OpenAIEmbeddings") as mock_embeddings:
         mock_instance = MagicMock()
         mock_instance.embed_query.return_value = [0.1] * 1536
@@ -0,0 +1,81 @@
+"""
+Tests for the Codantix command line interface.
+"""
+
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from codantix.cli import cli
+from codantix.commands.common import PENDING_BATCHES_PER_REQUEST, forget_files, generate_docs
+from codantix.hash_store import HashStore, element_key
+
+
+def test_cli_lists_all_commands():
+    """Test that every lazily registered command is listed in the help."""
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in ("init", "doc-pr", "update-db", "serve", "generate-config"):
+        assert name in result.output
+
+
+def test_cli_loads_only_the_invoked_command(monkeypatch):
+    """Test that invoking one command does not import the others."""
+    for module in ("codantix.commands.init", "codantix.commands.generate_config"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    result = CliRunner().invoke(cli, ["generate-config", "--help"])
+    assert result.exit_code == 0
+    assert "codantix.commands.generate_config" in sys.modules
+    assert "codantix.commands.init" not in sys.modules
+
+
+class _BatchGenerator:
+    """Documentation generator stub failing the batch holding ``fail_on``."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+
+    async def agenerate_docs_batch(self, elements, context, k):
+        if self.fail_on in elements:
+            raise RuntimeError("LLM request failed")
+        return [f"Doc for {element}." for element in elements]
+
+
+def test_generate_docs_streams_results_in_order_with_bounded_pending_batches():
+    """Test that results are yielded in order while only a bounded number of batches is pending."""
+    generator = _BatchGenerator()
+    consumed = []
+
+    def items():
+        for i in range(50):
+            consumed.append(i)
+            yield (str(i),)
+
+    results = generate_docs(generator, items(), {}, 2, 3, "Testing")
+    assert next(results) == (("0",), "Doc for 0.")
+    assert len(consumed) <= 3 * (2 * PENDING_BATCHES_PER_REQUEST + 1)
+    assert [doc for _, doc in results] == [f"Doc for {i}." for i in range(1, 50)]
+
+
+def test_generate_docs_yields_earlier_batches_before_a_failure():
+    """Test that a failing batch does not discard the results of the batches before it."""
+    generator = _BatchGenerator(fail_on="4")
+    results = generate_docs(generator, ((str(i),) for i in range(10)), {}, 4, 2, "Testing")
+
+    assert [next(results)[1] for _ in range(4)] == [f"Doc for {i}." for i in range(4)]
+    with pytest.raises(RuntimeError):
+        next(results)
+
+
+def test_forget_files_drops_file_and_element_hashes(tmp_path):
+    """Test that a removed file leaves no hashes that would skip it once restored."""
+    file_hashes = HashStore(tmp_path / "file_hashes.json")
+    hashes = HashStore(tmp_path / "hashes.json")
+    for file_path in ("/repo/gone.py", "/repo/kept.py"):
+        file_hashes.set(file_path, "file-digest")
+        hashes.set(element_key(file_path, "function", "run"), "element-digest")
+
+    forget_files({"/repo/gone.py"}, file_hashes, hashes)
+    assert file_hashes.keys() == ["/repo/kept.py"]
+    assert hashes.keys() == [element_key("/repo/kept.py", "function", "run")]
@@ -15,6 +15,7 @@ from codantix.config import (
     LLMConfig,
     VectorDBConfig,
     VectorDBType,
+    _LOAD_CACHE,
 )
 
 
@@ -110,6 +111,52 @@ def test_config_loads_from_path_object(temp_config_file):
     assert config.languages == ["python", "javascript"]
 
 
+def test_config_load_is_cached_until_file_changes(temp_config_file):
+    """Test that repeated loads return independent copies and pick up file changes."""
+    first = Config.load(temp_config_file)
+    first.source_paths.append("mutated")
+    second = Config.load(temp_config_file)
+    assert second.source_paths == ["src", "lib"]
+
+    data = json.loads(temp_config_file.read_text())
+    data["source_paths"] = ["app"]
+    temp_config_file.write_text(json.dumps(data))
+    assert Config.load(temp_config_file).source_paths == ["app"]
+
+
+def test_config_load_empty_file_uses_defaults(tmp_path):
+    """Test that an empty config file yields the default configuration."""
+    path = tmp_path / "codantix.config.yaml"
+    path.write_text("")
+    config = Config.load(path)
+    assert config == Config(config_path=str(path))
+    assert config.config_path == str(path)
+
+
+def test_config_load_rejects_non_mapping(tmp_path):
+    """Test that a config file whose top level is not a mapping fails validation."""
+    path = tmp_path / "codantix.config.yaml"
+    path.write_text("- python\n- java\n")
+    with pytest.raises(ConfigValidationError, match="valid dictionary"):
+        Config.load(path)
+
+
+def test_config_load_cache_is_bounded(tmp_path):
+    """Test that the load cache keeps only the most recently used files and can be cleared."""
+    Config.clear_load_cache()
+    paths = []
+    for i in range(10):
+        path = tmp_path / f"config{i}.json"
+        path.write_text(json.dumps({"name": f"project{i}"}))
+        paths.append(path)
+        assert Config.load(path).name == f"project{i}"
+    assert len(_LOAD_CACHE) == 8
+    assert str(paths[0]) not in _LOAD_CACHE and str(paths[-1]) in _LOAD_CACHE
+
+    Config.clear_load_cache()
+    assert not _LOAD_CACHE
+
+
 def test_config_validation():
     """Test configuration validation."""
     config = Config()
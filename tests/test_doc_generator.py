@@ -74,6 +74,32 @@ def test_doc_generator_initialization(mock_llm):
     assert generator.llm == mock_llm
 
 
+def test_doc_generator_creates_llm_on_first_use():
+    """Test that the configured LLM is only created when it is first needed."""
+    model = MagicMock()
+    with patch("codantix.doc_generator.init_chat_model", return_value=model) as init_chat_model:
+        generator = DocumentationGenerator(
+            doc_style=DocStyle.GOOGLE,
+            llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        )
+        init_chat_model.assert_not_called()
+        assert generator.llm is model
+        assert generator.llm is model
+    init_chat_model.assert_called_once()
+
+
+def test_rate_limiter_only_when_rate_is_set():
+    """Test that requests are throttled only when a request rate is configured."""
+    with patch("codantix.doc_generator.init_chat_model") as init_chat_model:
+        DocumentationGenerator(llm_config=LLMConfig(provider="openai", llm_model="gpt-4")).llm
+        assert init_chat_model.call_args.kwargs["rate_limiter"] is None
+
+        config = LLMConfig(provider="openai", llm_model="gpt-4")
+        config.rate_limit.llm_requests_per_second = 2
+        DocumentationGenerator(llm_config=config).llm
+        assert init_chat_model.call_args.kwargs["rate_limiter"].requests_per_second == 2
+
+
 def test_doc_generator_invalid_style(mock_llm):
     """Test documentation generator with invalid style."""
     with pytest.raises(AssertionError):
@@ -202,6 +228,23 @@ def test_doc_template_structure(mock_llm):
     assert "{description}" in template.method_template
 
 
+def test_google_templates_are_quoted_docstrings(mock_llm):
+    """Test that Google templates are complete quoted docstrings, since they are emitted as-is."""
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=mock_llm,
+    )
+    templates = generator.templates[DocStyle.GOOGLE]
+    for template in (
+        templates.module_template,
+        templates.class_template,
+        templates.function_template,
+        templates.method_template,
+    ):
+        assert template.startswith('"""') and template.endswith('"""')
+
+
 def test_error_handling(sample_elements, sample_context, mock_llm):
     """Test error handling in documentation generation."""
     generator = DocumentationGenerator(
@@ -213,3 +256,218 @@ def test_error_handling(sample_elements, sample_context, mock_llm):
     # Test with invalid element type
     with pytest.raises(AttributeError):
         generator._get_element_type(None)
+
+
+def test_generate_docs_batch(sample_elements, sample_context):
+    """Test that batched generation maps JSON answers back to elements."""
+    from langchain_core.messages import AIMessage
+
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(
+        content='```json\n[{"id": 1, "doc": "Module doc"}, {"id": 2, "doc": "Class doc"}]\n```'
+    )
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+    )
+    docs = generator.generate_docs_batch(sample_elements[:2], sample_context, k=8)
+    assert docs == ["Module doc", "Class doc"]
+    assert llm.invoke.call_count == 1
+    prompt = llm.invoke.call_args[0][0][1]["content"]
+    assert "### Element 1: module 'test_module'" in prompt
+    assert "### Element 2: class 'TestClass'" in prompt
+
+
+def test_batch_prompt_sends_shared_hierarchy_once(sample_elements, sample_context):
+    """Test that hierarchy rows common to a batch appear once, before the elements."""
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=MagicMock(),
+    )
+    context = dict(sample_context, class_docs={"TestClass": "Holds test state."})
+    prompt = generator._create_batch_prompt(sample_elements, context)
+    assert prompt.startswith("Hierarchy context:\nPackage: To demonstrate")
+    assert prompt.count("Package: ") == 1
+    method_section = prompt.split("### Element 3:")[1].split("### Element 4:")[0]
+    assert "Class: Holds test state." in method_section
+
+
+def test_generate_doc_uses_response_cache(sample_elements, sample_context, tmp_path):
+    """Test that a repeated request is answered from the cache without calling the LLM."""
+    from langchain_core.messages import AIMessage
+
+    from codantix.llm_cache import LLMCache
+
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(content="Cached docs")
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+        cache=LLMCache(tmp_path / "llm_cache.sqlite"),
+    )
+    first = generator.generate_doc(sample_elements[3], sample_context)
+    second = generator.generate_doc(sample_elements[3], sample_context)
+    assert first.content == second.content == "Cached docs"
+    assert llm.invoke.call_count == 1
+
+
+def test_batched_docs_are_cached_per_element(sample_elements, sample_context, tmp_path):
+    """Test that elements documented in one batch are found again in a differently composed batch."""
+    from langchain_core.messages import AIMessage
+
+    from codantix.llm_cache import LLMCache
+
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(content='[{"id": 1, "doc": "Module doc"}, {"id": 2, "doc": "Class doc"}]')
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+        cache=LLMCache(tmp_path / "llm_cache.sqlite"),
+    )
+    generator.generate_docs_batch(sample_elements[:2], sample_context)
+    docs = generator.generate_docs_batch([sample_elements[1], sample_elements[0]], sample_context)
+    assert docs == ["Class doc", "Module doc"]
+    assert llm.invoke.call_count == 1
+
+
+def test_agenerate_many_retries_rate_limited_requests(sample_elements, sample_context):
+    """Test that rate-limit errors are retried and concurrent results keep their order."""
+    import asyncio
+
+    from langchain_core.messages import AIMessage
+
+    llm = MagicMock()
+    failures = iter([Exception("Error code: 429 - rate limit exceeded")])
+
+    async def ainvoke(messages):
+        failure = next(failures, None)
+        if failure is not None:
+            raise failure
+        return AIMessage(content=messages[1]["content"].split("named ")[1].split("'")[1])
+
+    llm.ainvoke.side_effect = ainvoke
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+    )
+    with patch("codantix.doc_generator._backoff_delay", return_value=0):
+        docs = asyncio.run(generator.agenerate_many(sample_elements, sample_context, max_concurrency=2))
+    assert [doc.content for doc in docs] == [e.name for e in sample_elements]
+    assert llm.ainvoke.call_count == len(sample_elements) + 1
+
+
+def test_hierarchy_context_module_rows_follow_context(sample_elements, sample_context):
+    """Test that cached module rows are recomputed for a new context dict."""
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=MagicMock(),
+    )
+    method = sample_elements[2]
+    first = dict(sample_context, module_docs={"test.py": "Old module.\nDetails."})
+    assert "Module: Old module." in generator._get_hierarchy_context(method, first)
+    second = dict(sample_context, module_docs={"test.py": "New module."})
+    assert "Module: New module." in generator._get_hierarchy_context(method, second)
+
+
+def test_concurrent_identical_requests_are_sent_once(sample_elements, sample_context):
+    """Test that identical async requests in flight share one LLM call."""
+    import asyncio
+
+    from langchain_core.messages import AIMessage
+
+    llm = MagicMock()
+
+    async def ainvoke(messages):
+        await asyncio.sleep(0.01)
+        return AIMessage(content="Shared docs")
+
+    llm.ainvoke.side_effect = ainvoke
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+    )
+    element = sample_elements[3]
+    docs = asyncio.run(generator.agenerate_many([element, element, element], sample_context))
+    assert [doc.content for doc in docs] == ["Shared docs"] * 3
+    assert llm.ainvoke.call_count == 1
+    assert not generator._inflight
+
+
+def test_generate_docs_batch_falls_back_on_invalid_json(sample_elements, sample_context):
+    """Test that unparseable batch answers fall back to per-element generation."""
+    from langchain_core.messages import AIMessage
+
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(content="not json")
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+    )
+    docs = generator.generate_docs_batch(sample_elements[:2], sample_context, k=8)
+    assert docs == ["not json", "not json"]
+    assert llm.invoke.call_count == 3
+
+
+def test_semantic_cache_embeds_batch_prompts_in_one_request(sample_elements, sample_context, tmp_path):
+    """Test that the async batch path embeds all pending prompts at once and reuses the vectors."""
+    import asyncio
+
+    from langchain_core.messages import AIMessage
+
+    from codantix.llm_cache import SemanticCache
+
+    embeddings = MagicMock()
+
+    async def aembed_documents(texts):
+        return [[float(i + 1), 1.0] for i in range(len(texts))]
+
+    embeddings.aembed_documents.side_effect = aembed_documents
+    llm = MagicMock()
+
+    async def ainvoke(messages):
+        return AIMessage(content='[{"id": 1, "doc": "First"}, {"id": 2, "doc": "Second"}]')
+
+    llm.ainvoke.side_effect = ainvoke
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+        semantic_cache=SemanticCache(tmp_path / "llm_cache.sqlite", embeddings),
+    )
+    docs = asyncio.run(generator.agenerate_docs_batch(sample_elements[:2], sample_context, k=8))
+    assert docs == ["First", "Second"]
+    # One request for the element prompts, one for the batch prompt sent to the LLM
+    first, second = embeddings.aembed_documents.call_args_list
+    assert len(first.args[0]) == 2 and len(second.args[0]) == 1
+    embeddings.embed_documents.assert_not_called()
+    embeddings.embed_query.assert_not_called()
+
+
+def test_agenerate_docs_batch(sample_elements, sample_context):
+    """Test that the async batch path uses ainvoke and preserves order."""
+    import asyncio
+
+    from langchain_core.messages import AIMessage
+
+    llm = MagicMock()
+
+    async def ainvoke(messages):
+        return AIMessage(content='[{"id": 2, "doc": "Second"}, {"id": 1, "doc": "First"}]')
+
+    llm.ainvoke.side_effect = ainvoke
+    generator = DocumentationGenerator(
+        doc_style=DocStyle.GOOGLE,
+        llm_config=LLMConfig(provider="openai", llm_model="gpt-4"),
+        llm=llm,
+    )
+    docs = asyncio.run(generator.agenerate_docs_batch(sample_elements[:2], sample_context))
+    assert docs == ["First", "Second"]
+    llm.invoke.assert_not_called()
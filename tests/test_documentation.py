@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 
 from codantix.config import ElementType
-from codantix.documentation import CodebaseTraverser, ReadmeParser
+from codantix.documentation import CodebaseTraverser, ReadmeParser, _process_file_worker
 
 
 @pytest.fixture
@@ -116,8 +116,67 @@ def test_codebase_traverser_unsupported_language(tmp_path):
     assert len(elements) == 0
 
 
+def test_codebase_traverser_skips_ignored_dirs(tmp_path):
+    """Test that dependency and tooling directories are not searched."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.js").write_text("function app() {}\n")
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.js").write_text("function lib() {}\n")
+    traverser = CodebaseTraverser(["javascript"])
+    assert traverser.find_files(tmp_path) == [tmp_path / "src" / "app.js"]
+
+
 def test_codebase_traverser_nonexistent_path():
     """Test codebase traverser with nonexistent path."""
     traverser = CodebaseTraverser(["python"])
     elements = traverser.traverse(Path("nonexistent"))
     assert len(elements) == 0
+
+
+def test_codebase_traverser_parallel(tmp_path):
+    """Test that parallel traversal finds the same elements as serial traversal."""
+    for i in range(4):
+        (tmp_path / f"mod{i}.py").write_text(f"def func_{i}():\n    pass\n")
+
+    traverser = CodebaseTraverser(["python"])
+    traverser.parallel_min_files = 0
+    serial = traverser.traverse(tmp_path)
+    parallel = traverser.traverse(tmp_path, max_workers=2)
+
+    assert [(e.file_path, e.name) for e in parallel] == [
+        (e.file_path, e.name) for e in serial
+    ]
+    assert sorted(e.name for e in parallel) == [f"func_{i}" for i in range(4)]
+
+
+def test_process_file_worker_honors_coding_cookie(tmp_path):
+    """Test that Python files are decoded with their declared encoding."""
+    path = tmp_path / "legacy.py"
+    path.write_bytes('# -*- coding: latin-1 -*-\r\ndef caf\u00e9():\r\n    """Caf\u00e9."""\r\n'.encode("latin-1"))
+
+    (element,) = _process_file_worker(path)
+    assert element.name == "caf\u00e9"
+    assert element.docstring == "Caf\u00e9."
+    assert "\r" not in element.source
+
+
+def test_codebase_traverser_reuses_parse_cache(tmp_path):
+    """Test that unchanged files are served from the parse cache, and edited files re-parsed."""
+    from unittest.mock import patch
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "a.py").write_text("def a():\n    pass\n")
+    (src / "b.py").write_text("def b():\n    pass\n")
+    cache_path = tmp_path / ".codantix" / "parse_cache.pkl"
+    elements = CodebaseTraverser(["python"], cache_path).traverse(src)
+    assert sorted(e.name for e in elements) == ["a", "b"]
+
+    (src / "b.py").write_text("def b2():\n    pass\n")
+    traverser = CodebaseTraverser(["python"], cache_path)
+    with patch(
+        "codantix.documentation._process_file_worker", wraps=_process_file_worker
+    ) as worker:
+        names = sorted(e.name for e in traverser.traverse(src))
+    assert names == ["a", "b2"]
+    assert [call.args[0].name for call in worker.call_args_list] == ["b.py"]
@@ -106,7 +106,7 @@ def test_store_embeddings_and_update_database_chroma(mock_chroma, chroma_args):
     texts = ["doc1", "doc2"]
     metas = [{"a": 1}, {"a": 2}]
     em.store_embeddings(texts, metas)
-    mock_db.add_documents.assert_called()
+    mock_db.add_texts.assert_called_once_with(texts, metadatas=metas)
     if hasattr(mock_db, "persist"):
         mock_db.persist.assert_called()
     docs = [
@@ -114,7 +114,9 @@ def test_store_embeddings_and_update_database_chroma(mock_chroma, chroma_args):
         {"text": "doc2", "metadata": {"a": 2}},
     ]
     em.update_database(docs)
-    mock_db.add_documents.assert_called()
+    upsert = mock_db._collection.upsert.call_args.kwargs
+    assert upsert["documents"] == ["doc1", "doc2"]
+    assert upsert["metadatas"] == [{"a": 1}, {"a": 2}]
 
 
 @patch("langchain_chroma.Chroma")
@@ -164,3 +166,158 @@ def test_remove_embedding_for_deleted_element(tmp_path):
     vecdb_path = args["persist_directory"]
     if os.path.exists(vecdb_path):
         shutil.rmtree(vecdb_path)
+
+
+@patch("langchain_chroma.Chroma")
+@pytest.mark.usefixtures("mock_embedding_model")
+def test_get_metadatas_chroma(mock_chroma, chroma_args):
+    mock_db = MagicMock()
+    mock_db.get.return_value = {"ids": ["1"], "metadatas": [{"element": "foo", "content_hash": "abc"}]}
+    mock_chroma.return_value = mock_db
+    em = EmbeddingManager(**chroma_args)
+    assert em.get_metadatas("some/file.py") == [{"element": "foo", "content_hash": "abc"}]
+    mock_db.get.assert_called_with(where={"file_path": "some/file.py"}, include=["metadatas"])
+
+
+@patch("langchain_chroma.Chroma")
+@pytest.mark.usefixtures("mock_embedding_model")
+def test_update_database_precomputes_embeddings(mock_chroma, chroma_args):
+    mock_db = MagicMock()
+    mock_chroma.return_value = mock_db
+    em = EmbeddingManager(**chroma_args)
+    texts = [f"doc{i}" for i in range(5)]
+    assert len(em.embed_texts(texts, batch_size=2)) == 5
+    em.update_database([{"text": text, "metadata": {"i": i}} for i, text in enumerate(texts)])
+    kwargs = mock_db._collection.upsert.call_args.kwargs
+    assert kwargs["documents"] == texts
+    assert kwargs["embeddings"].shape == (5, 1536)
+    mock_db.add_texts.assert_not_called()
+
+
+@patch("langchain_chroma.Chroma")
+@pytest.mark.usefixtures("mock_embedding_model")
+def test_update_database_consumes_generator_in_batches(mock_chroma, chroma_args):
+    mock_db = MagicMock()
+    mock_chroma.return_value = mock_db
+    em = EmbeddingManager(**chroma_args)
+    docs = ({"text": f"doc{i}", "metadata": {"i": i}} for i in range(5))
+    em.update_database(docs, batch_size=2)
+    batches = [c.kwargs["documents"] for c in mock_db._collection.upsert.call_args_list]
+    assert batches == [["doc0", "doc1"], ["doc2", "doc3"], ["doc4"]]
+    mock_db.persist.assert_called_once()
+
+
+@patch("langchain_chroma.Chroma")
+@pytest.mark.usefixtures("mock_embedding_model")
+def test_update_database_upserts_by_id(mock_chroma, chroma_args):
+    mock_db = MagicMock()
+    mock_chroma.return_value = mock_db
+    em = EmbeddingManager(**chroma_args)
+    em.update_database(
+        [
+            {"id": "1", "text": "old", "metadata": {"i": 1}},
+            {"id": "2", "text": "other", "metadata": {"i": 2}},
+            {"id": "1", "text": "new", "metadata": {"i": 1}},
+        ]
+    )
+    kwargs = mock_db._collection.upsert.call_args.kwargs
+    assert kwargs["ids"] == ["1", "2"]
+    assert kwargs["documents"] == ["new", "other"]
+
+
+@patch("langchain_chroma.Chroma")
+def test_embed_texts_embeds_duplicates_once(mock_chroma, chroma_args, mock_embedding_model):
+    em = EmbeddingManager(**chroma_args)
+    embed_documents = mock_embedding_model.return_value.embed_documents
+    embed_documents.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    vectors = em.embed_texts(["a", "bb", "a", ""])
+    assert vectors == [[1.0], [2.0], [1.0], [0.0]]
+    embed_documents.assert_called_once_with(["a", "bb", ""])
+
+
+@patch("langchain_chroma.Chroma")
+def test_generate_embeddings_batches_and_retries_rate_limits(mock_chroma, chroma_args, mock_embedding_model):
+    em = EmbeddingManager(**chroma_args, batch_size=2)
+    embed_documents = mock_embedding_model.return_value.embed_documents
+    failures = iter([Exception("Error code: 429 - rate limit exceeded")])
+
+    def embed(texts):
+        failure = next(failures, None)
+        if failure is not None:
+            raise failure
+        return [[float(len(text))] for text in texts]
+
+    embed_documents.side_effect = embed
+    with patch("codantix.embedding._backoff_delay", return_value=0):
+        vectors = em.generate_embeddings(["a", "bb", "ccc"])
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert [c.args[0] for c in embed_documents.call_args_list] == [["a", "bb"], ["a", "bb"], ["ccc"]]
+
+
+@patch("langchain_chroma.Chroma")
+def test_embed_texts_async_mode_uses_async_api(mock_chroma, chroma_args, mock_embedding_model):
+    em = EmbeddingManager(**chroma_args, batch_size=2, async_mode=True)
+
+    async def aembed(texts):
+        return [[float(len(text))] for text in texts]
+
+    mock_embedding_model.return_value.aembed_documents.side_effect = aembed
+    assert em.embed_texts(["a", "bb", "ccc", "a"]) == [[1.0], [2.0], [3.0], [1.0]]
+    mock_embedding_model.return_value.embed_documents.assert_not_called()
+
+
+@patch("langchain_chroma.Chroma")
+def test_embed_texts_reuses_cached_vectors(mock_chroma, chroma_args, mock_embedding_model, tmp_path):
+    cache_path = tmp_path / "embedding_cache.sqlite"
+    embed_documents = mock_embedding_model.return_value.embed_documents
+    embed_documents.side_effect = lambda texts: [[float(len(text))] for text in texts]
+    EmbeddingManager(**chroma_args, cache_path=cache_path).embed_texts(["a", "bb"])
+
+    em = EmbeddingManager(**chroma_args, cache_path=cache_path)
+    assert em.embed_texts(["bb", "ccc", "a"]) == [[2.0], [3.0], [1.0]]
+    embed_documents.assert_called_with(["ccc"])
+
+
+@patch("langchain_chroma.Chroma")
+def test_embedding_client_is_shared_between_managers(mock_chroma, chroma_args, mock_embedding_model):
+    first = EmbeddingManager(**chroma_args)
+    second = EmbeddingManager(**chroma_args)
+    assert second.embeddings is first.embeddings
+    mock_embedding_model.assert_called_once()
+    EmbeddingManager(**chroma_args, batch_size=4)
+    assert mock_embedding_model.call_count == 2
+
+
+@patch("langchain_qdrant.QdrantVectorStore")
+@patch("qdrant_client.QdrantClient")
+def test_qdrant_quantize_creates_int8_collection(mock_client, mock_qdrant, qdrant_args, mock_embedding_model):
+    client = mock_client.return_value
+    client.collection_exists.return_value = False
+    mock_embedding_model.return_value.embed_query.return_value = [0.1] * 8
+    EmbeddingManager(**qdrant_args, quantize=True)
+    kwargs = client.create_collection.call_args.kwargs
+    assert kwargs["quantization_config"].scalar.type == "int8"
+    assert kwargs["vectors_config"].size == 8
+    assert mock_qdrant.call_args.kwargs["client"] is client
+
+
+@patch("langchain_qdrant.QdrantVectorStore")
+@patch("qdrant_client.QdrantClient")
+def test_qdrant_quantize_updates_existing_collection(mock_client, mock_qdrant, qdrant_args):
+    client = mock_client.return_value
+    client.collection_exists.return_value = True
+    EmbeddingManager(**qdrant_args, quantize=True)
+    client.create_collection.assert_not_called()
+    assert client.update_collection.call_args.kwargs["quantization_config"].scalar.type == "int8"
+
+
+@patch("langchain_chroma.Chroma")
+def test_update_database_embeds_texts_with_their_location(mock_chroma, chroma_args, mock_embedding_model):
+    mock_db = MagicMock()
+    mock_chroma.return_value = mock_db
+    embed_documents = mock_embedding_model.return_value.embed_documents
+    em = EmbeddingManager(**chroma_args)
+    metadata = {"file_path": "pkg/mod.py", "element": "run", "parent": "Job"}
+    em.update_database([{"text": "Run the job.", "metadata": metadata}])
+    embed_documents.assert_called_once_with(["pkg/mod.py::Job.run\nRun the job."])
+    assert mock_db._collection.upsert.call_args.kwargs["documents"] == ["Run the job."]
@@ -3,6 +3,7 @@ Tests for Git integration functionality.
 """
 import pytest
 from pathlib import Path
+from unittest.mock import PropertyMock, patch
 import git
 from codantix.git_integration import GitIntegration, FileChange
 
@@ -53,6 +54,19 @@ def test_get_changed_files(git_repo):
     assert new_file.diff  # Ensure diff is not empty
     assert len(new_file.hunks) > 0
 
+def test_get_changed_files_reports_renames_at_new_path(git_repo):
+    """Test that a renamed and edited file is reported under its new path."""
+    repo_path, _ = git_repo
+    repo = git.Repo(repo_path)
+    repo.index.move(['test.py', 'renamed.py'])
+    (repo_path / "renamed.py").write_text((repo_path / "renamed.py").read_text() + '\ndef extra():\n    pass\n')
+    repo.index.add(['renamed.py'])
+    commit = repo.index.commit('Rename module')
+
+    changes = GitIntegration(repo_path).get_changed_files(commit.hexsha)
+    assert [c.file_path for c in changes] == [Path('renamed.py')]
+    assert '+def extra():' in changes[0].diff
+
 def test_get_file_content(git_repo):
     """Test getting file content at a specific commit."""
     repo_path, commit_sha = git_repo
@@ -63,6 +77,18 @@ def test_get_file_content(git_repo):
     assert 'Updated module docstring' in content
     assert 'Function docstring' in content
 
+def test_get_file_content_reads_each_blob_once(git_repo):
+    """Test that unchanged files are read once across commits."""
+    repo_path, commit_sha = git_repo
+    git_integration = GitIntegration(repo_path)
+    parent_sha = git_integration.repo.commit(commit_sha).parents[0].hexsha
+
+    with patch.object(git.Blob, 'data_stream', new_callable=PropertyMock) as data_stream:
+        data_stream.return_value.read.return_value = b'// JavaScript file\n'
+        assert git_integration.get_file_content(Path('test.js'), parent_sha) == '// JavaScript file\n'
+        assert git_integration.get_file_content(Path('test.js'), commit_sha) == '// JavaScript file\n'
+    assert data_stream.call_count == 1
+
 def test_get_commit_message(git_repo):
     """Test getting commit message."""
     repo_path, commit_sha = git_repo
@@ -79,6 +105,19 @@ def test_get_branch_name(git_repo):
     branch_name = git_integration.get_branch_name(commit_sha)
     assert branch_name == 'feature-branch'
 
+def test_commit_is_resolved_once_per_sha(git_repo, monkeypatch):
+    """Test that repeated lookups of one commit reuse the resolved object."""
+    repo_path, commit_sha = git_repo
+    git_integration = GitIntegration(repo_path)
+    calls = []
+    resolve = git_integration.repo.commit
+    monkeypatch.setattr(git_integration.repo, 'commit', lambda rev: calls.append(rev) or resolve(rev))
+
+    git_integration.get_changed_files(commit_sha)
+    git_integration.get_file_content(Path('test.py'), commit_sha)
+    git_integration.get_commit_message(commit_sha)
+    assert calls.count(commit_sha) == 1
+
 def test_invalid_commit_sha(git_repo):
     """Test handling of invalid commit SHA."""
     repo_path, _ = git_repo
@@ -110,5 +149,34 @@ def test_extract_hunks():
     hunks = git_integration._extract_hunks(diff)
     
     assert len(hunks) == 2
-    assert hunks[0] == (1, 2)  # First hunk: line 1 to 2
-    assert hunks[1] == (6, 7)  # Second hunk: line 6 to 7 
\ No newline at end of file
+    assert hunks[0] == (1, 4)  # First hunk: new lines 1 to 4
+    assert hunks[1] == (6, 13)  # Second hunk: new lines 6 to 13
+    assert git_integration._extract_hunks("@@ -3 +2,0 @@\n-gone\n") == [(2, 2)]
+
+def test_get_changed_files_hunks_cover_changed_lines_only(git_repo):
+    """Test that hunks span only the changed lines, without context lines."""
+    repo_path, _ = git_repo
+    repo = git.Repo(repo_path)
+    lines = [f"x{i} = {i}\n" for i in range(20)]
+    (repo_path / "long.py").write_text("".join(lines))
+    repo.index.add(['long.py'])
+    repo.index.commit('Add long module')
+    lines[9] = "x9 = 'changed'\n"
+    (repo_path / "long.py").write_text("".join(lines))
+    repo.index.add(['long.py'])
+    commit = repo.index.commit('Change one line')
+
+    (change,) = GitIntegration(repo_path).get_changed_files(commit.hexsha)
+    assert change.hunks == [(10, 10)]
+
+def test_get_changed_files_of_root_commit(git_repo):
+    """Test that the source files of a commit without parent are reported as added."""
+    repo_path, commit_sha = git_repo
+    git_integration = GitIntegration(repo_path)
+    root_sha = git_integration.get_parent_sha(commit_sha)
+
+    changes = git_integration.get_changed_files(root_sha)
+    assert sorted(str(c.file_path) for c in changes) == ['test.js', 'test.py']
+    assert all(c.change_type == 'A' and c.hunks[0][0] == 1 for c in changes)
+    content = git_integration.get_file_content(Path('test.py'), root_sha)
+    assert next(c for c in changes if c.file_path.name == 'test.py').hunks[0][1] >= len(content.splitlines())
@@ -0,0 +1,56 @@
+"""
+Tests for the content hash store.
+"""
+
+from codantix.hash_store import HashStore, content_hash, element_key, file_hash
+
+
+def test_content_hash_is_stable():
+    """Test that equal text hashes equally and different text does not."""
+    assert content_hash("def foo(): pass") == content_hash("def foo(): pass")
+    assert content_hash("def foo(): pass") != content_hash("def bar(): pass")
+
+
+def test_element_key_includes_parent():
+    """Test that methods with the same name in different classes get distinct keys."""
+    assert element_key("a.py", "method", "run", "A") != element_key("a.py", "method", "run", "B")
+    assert element_key("a.py", "function", "run") == "a.py::function::::run"
+
+
+def test_hash_store_round_trip(tmp_path):
+    """Test that saved hashes are loaded by a new store."""
+    path = tmp_path / ".codantix" / "hashes.json"
+    store = HashStore(path)
+    assert store.get("key") is None
+    store.set("key", "abc")
+    store.save()
+    assert path.exists()
+    assert HashStore(path).get("key") == "abc"
+
+
+def test_hash_store_ignores_corrupt_file(tmp_path):
+    """Test that a corrupt hash file yields an empty store."""
+    path = tmp_path / "hashes.json"
+    path.write_text("{not json")
+    assert HashStore(path).hashes == {}
+
+
+def test_file_hash_depends_on_content_and_salt(tmp_path):
+    """Test that file hashes change with the file content and the salt."""
+    path = tmp_path / "a.py"
+    path.write_text("x = 1\n")
+    digest = file_hash(path, "google:v1")
+    assert file_hash(path, "google:v1") == digest
+    assert file_hash(path, "numpy:v1") != digest
+    path.write_text("x = 2\n")
+    assert file_hash(path, "google:v1") != digest
+
+
+def test_hash_store_remove(tmp_path):
+    """Test that removed keys are forgotten."""
+    store = HashStore(tmp_path / "hashes.json")
+    store.set("a", "1")
+    store.set("b", "2")
+    store.remove("a")
+    store.remove("missing")
+    assert store.keys() == ["b"]
@@ -2,7 +2,9 @@
 Tests for incremental documentation generation.
 """
 
+import json
 import os
+from unittest.mock import patch
 
 import git
 import pytest
@@ -10,6 +12,7 @@ import pytest
 from codantix.config import ElementType, LLMConfig
 from codantix.doc_generator import DocStyle
 from codantix.incremental_doc import DocumentationChange, IncrementalDocumentation
+from codantix.parsers import PythonParser
 
 pytestmark = pytest.mark.usefixtures("patch_llm")
 
@@ -203,6 +206,8 @@ def test_project_context_extraction(tmp_path):
     )
     assert "architecture" in context and "Layered" in context["architecture"]
     assert "purpose" in context and "context extraction" in context["purpose"]
+    (tmp_path / "README.md").unlink()
+    assert inc._get_project_context(commit.hexsha) == context
 
 
 @pytest.mark.usefixtures("patch_llm")
@@ -219,3 +224,128 @@ def test_existing_doc_extraction(git_repo):
             assert "Function docstring" in change.old_doc
             found = True
     assert found, "No function with existing docstring found in changes."
+
+
+def test_commit_elements_are_documented_in_batches(git_repo):
+    """Test that the changed elements of all files are documented in batched requests."""
+    repo_path, commit_sha = git_repo
+    llm_config = LLMConfig(provider="openai", llm_model="gpt-4")
+    inc = IncrementalDocumentation("test", repo_path, llm_config=llm_config, batch_size=2)
+    batches = []
+
+    async def document(elements, context, k):
+        batches.append([e.name for e in elements])
+        return [f"Doc for {e.name}." for e in elements]
+
+    inc.doc_generator.agenerate_docs_batch = document
+    changes = inc.process_commit(commit_sha)
+
+    assert [len(batch) for batch in batches] == [2] * (len(changes) // 2) + [1] * (len(changes) % 2)
+    assert [c.element.name for c in changes] == [name for batch in batches for name in batch]
+    assert all(c.new_doc == f"Doc for {c.element.name}." for c in changes)
+
+
+def test_only_elements_overlapping_hunks_are_documented(git_repo):
+    """Test that each changed file is parsed once and its changed elements are documented once."""
+    repo_path, _ = git_repo
+    repo = git.Repo(repo_path)
+    source = "def first():\n    return 1\n\n\ndef second():\n    value = 2\n    return value\n"
+    (repo_path / "funcs.py").write_text(source)
+    repo.index.add(["funcs.py"])
+    repo.index.commit("Add functions")
+    # Two separate hunks within second()
+    (repo_path / "funcs.py").write_text(source.replace("second():", "second(): # edited").replace("return value", "return -value"))
+    repo.index.add(["funcs.py"])
+    commit = repo.index.commit("Change second")
+
+    inc = IncrementalDocumentation("test", repo_path, llm_config=LLMConfig(provider="openai", llm_model="gpt-4"))
+
+    async def document(elements, context, k):
+        return [f"Doc for {e.name}." for e in elements]
+
+    inc.doc_generator.agenerate_docs_batch = document
+    with patch("codantix.parsers.PythonParser.parse_file", autospec=True, side_effect=PythonParser.parse_file) as parse_file:
+        changes = inc.process_commit(commit.hexsha)
+    assert [c.element.name for c in changes] == ["second"]
+    parse_file.assert_called_once()
+
+
+def test_documented_elements_with_unchanged_source_skip_the_llm(git_repo):
+    """Test that a documented element whose source did not change keeps its docstring."""
+    repo_path, _ = git_repo
+    repo = git.Repo(repo_path)
+    source = 'def kept():\n    """Kept docs."""\n    return 1\n\n\ndef dropped():\n    return 2\n'
+    (repo_path / "funcs.py").write_text(source)
+    repo.index.add(["funcs.py"])
+    repo.index.commit("Add functions")
+    # Deleting a function yields a hunk anchored on the last line of the function before it
+    (repo_path / "funcs.py").write_text(source.split("\n\n\n")[0] + "\n")
+    repo.index.add(["funcs.py"])
+    commit = repo.index.commit("Drop a function")
+
+    inc = IncrementalDocumentation("test", repo_path, llm_config=LLMConfig(provider="openai", llm_model="gpt-4"))
+    documented = []
+
+    async def document(elements, context, k):
+        documented.extend(e.name for e in elements)
+        return [f"Doc for {e.name}." for e in elements]
+
+    inc.doc_generator.agenerate_docs_batch = document
+    (change,) = inc.process_commit(commit.hexsha)
+    assert change.element.name == "kept"
+    assert change.new_doc == "Kept docs."
+    assert change.change_type == "unchanged"
+    assert documented == []
+
+
+def test_commit_is_documented_through_the_batched_llm_prompt(git_repo, monkeypatch):
+    """Test that process_commit parses batched LLM answers back onto their elements, in order."""
+    from langchain_openai.chat_models import ChatOpenAI
+
+    repo_path, commit_sha = git_repo
+    llm_config = LLMConfig(provider="openai", llm_model="gpt-4")
+    inc = IncrementalDocumentation("test", repo_path, llm_config=llm_config, batch_size=2)
+    prompts = []
+    agenerate = ChatOpenAI._agenerate
+
+    async def record(self, messages, *args, **kwargs):
+        prompts.append(next(m.content for m in messages if m.type == "human"))
+        return await agenerate(self, messages, *args, **kwargs)
+
+    monkeypatch.setattr(ChatOpenAI, "_agenerate", record)
+    changes = inc.process_commit(commit_sha)
+
+    assert len(changes) > 1
+    assert all("### Element 1:" in prompt for prompt in prompts)
+    assert len(prompts) == (len(changes) + 1) // 2
+    for change in changes:
+        expected = f"Generated documentation for {change.element.type.value} '{change.element.name}'."
+        assert change.new_doc == expected
+
+
+def test_commit_elements_missing_from_a_batched_answer_fall_back_to_single_prompts(git_repo, monkeypatch):
+    """Test that elements a batched answer leaves out are documented one by one."""
+    from langchain_openai.chat_models import ChatOpenAI
+
+    repo_path, commit_sha = git_repo
+    llm_config = LLMConfig(provider="openai", llm_model="gpt-4")
+    inc = IncrementalDocumentation("test", repo_path, llm_config=llm_config, batch_size=2)
+    single_prompts = []
+    agenerate = ChatOpenAI._agenerate
+
+    async def drop_second(self, messages, *args, **kwargs):
+        result = await agenerate(self, messages, *args, **kwargs)
+        message = result.generations[0].message
+        if message.content.startswith("["):
+            message.content = json.dumps([item for item in json.loads(message.content) if item["id"] != 2])
+        else:
+            single_prompts.append(message.content)
+        return result
+
+    monkeypatch.setattr(ChatOpenAI, "_agenerate", drop_second)
+    changes = inc.process_commit(commit_sha)
+
+    assert len(single_prompts) == len(changes) // 2
+    for change in changes:
+        expected = f"Generated documentation for {change.element.type.value} '{change.element.name}'."
+        assert change.new_doc == expected
@@ -0,0 +1,79 @@
+"""
+Tests for the LLM response cache.
+"""
+
+from unittest.mock import patch
+
+from codantix.llm_cache import LLMCache, SemanticCache, request_key
+
+
+def test_request_key_depends_on_messages_model_and_params():
+    """Test that any change to the request changes its key."""
+    messages = [{"role": "user", "content": "Document foo"}]
+    key = request_key(messages, "openai:gpt-4", {"temperature": 0.7})
+    assert key == request_key(messages, "openai:gpt-4", {"temperature": 0.7})
+    assert key != request_key(messages, "openai:gpt-4o", {"temperature": 0.7})
+    assert key != request_key(messages, "openai:gpt-4", {"temperature": 0.0})
+    assert key != request_key([{"role": "user", "content": "Document bar"}], "openai:gpt-4", {"temperature": 0.7})
+
+
+def test_llm_cache_round_trip_and_ttl(tmp_path):
+    """Test that answers persist across instances and expire after the TTL."""
+    path = tmp_path / ".codantix" / "llm_cache.sqlite"
+    cache = LLMCache(path)
+    assert cache.get(b"key") is None
+    cache.set(b"key", "Docs for foo.", "gpt-4")
+    cache.close()
+
+    assert LLMCache(path).get(b"key") == "Docs for foo."
+    with patch("codantix.llm_cache.time.time", return_value=10**10):
+        assert LLMCache(path, ttl_seconds=60).get(b"key") is None
+
+
+def test_llm_cache_evicts_oldest_beyond_max_entries(tmp_path):
+    """Test that reopening the cache keeps only the newest answers."""
+    path = tmp_path / "llm_cache.sqlite"
+    cache = LLMCache(path)
+    for i in range(3):
+        with patch("codantix.llm_cache.time.time", return_value=1000 + i):
+            cache.set(bytes([i]), f"answer {i}")
+    cache.close()
+
+    cache = LLMCache(path, max_entries=2)
+    assert cache.get(bytes([0])) is None
+    assert cache.get(bytes([2])) == "answer 2"
+
+
+class _WordEmbeddings:
+    """Embeds a text as counts of a few words."""
+
+    words = ("foo", "bar", "style", "module")
+
+    def embed_documents(self, texts):
+        return [[text.count(word) for word in self.words] for text in texts]
+
+
+def test_semantic_cache_matches_similar_prompts_of_the_same_model(tmp_path):
+    """Test that near-identical prompts share an answer, persisted across instances."""
+    path = tmp_path / "llm_cache.sqlite"
+    cache = SemanticCache(path, _WordEmbeddings(), threshold=0.97)
+    cache.set("foo foo style module", "Docs for foo.", "openai:gpt-4")
+    cache.close()
+
+    cache = SemanticCache(path, _WordEmbeddings(), threshold=0.97)
+    assert cache.get("foo foo style module!", "openai:gpt-4") == "Docs for foo."
+    assert cache.get("foo foo style module", "openai:gpt-4o") is None
+    assert cache.get("bar bar style module", "openai:gpt-4") is None
+
+
+def test_semantic_cache_stores_answers_under_given_vectors(tmp_path):
+    """Test that set() reuses a vector embedded for the lookup instead of embedding again."""
+    embeddings = _WordEmbeddings()
+    cache = SemanticCache(tmp_path / "llm_cache.sqlite", embeddings, threshold=0.97)
+    vectors = cache.embed(["foo style", "bar module"])
+    assert [cache.lookup(vector, "openai:gpt-4") for vector in vectors] == [None, None]
+
+    with patch.object(embeddings, "embed_documents") as embed_documents:
+        cache.set("foo style", "Docs for foo.", "openai:gpt-4", vectors[0])
+    embed_documents.assert_not_called()
+    assert cache.get("foo style", "openai:gpt-4") == "Docs for foo."
@@ -4,6 +4,7 @@ Tests for language-specific parsers.
 
 import ast
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -134,6 +135,38 @@ def test_parser_selection():
     assert isinstance(get_parser(Path("test.java")), JavaParser)
 
 
+def test_python_parser_async_definitions():
+    """Test that async functions and methods are found, with their source."""
+    parser = PythonParser()
+    content = '''class Client:
+    async def fetch(self):
+        """Fetch data."""
+        return 1
+
+async def main():
+    pass
+'''
+    elements = parser.parse_file(content, 1, 7)
+    assert [(e.name, e.type, e.parent) for e in elements] == [
+        ("Client", ElementType.CLASS, None),
+        ("fetch", ElementType.METHOD, "Client"),
+        ("main", ElementType.FUNCTION, None),
+    ]
+    assert elements[1].docstring == "Fetch data."
+    assert elements[2].source == "async def main():\n    pass"
+
+
+def test_python_parser_skips_modules_without_definitions():
+    """Test that modules without definitions are skipped, but not their docstrings."""
+    parser = PythonParser()
+    with patch("codantix.parsers.ast.parse", wraps=ast.parse) as parse:
+        assert parser.parse_file("# Re-exports\nfrom pkg.mod import name\n", 1, 2) == []
+        parse.assert_not_called()
+        for content in ('"""Package docstring."""\nimport os\n', 'rb"raw"\n', "None\n"):
+            assert parser.parse_file(content, 1, 2)[0].type == ElementType.MODULE
+        assert parse.call_count == 3
+
+
 def test_python_syntax_error():
     """Test handling of Python syntax errors."""
     parser = PythonParser()
@@ -0,0 +1,58 @@
+"""
+Tests for the Codantix command server.
+"""
+
+import threading
+
+import click
+import pytest
+
+from codantix.server import forward, make_server, run_command
+
+
+@click.group()
+def group():
+    pass
+
+
+@group.command()
+@click.option("--name", default="world")
+def greet(name):
+    click.echo(f"hello {name}")
+
+
+@group.command()
+def fail():
+    click.echo("boom", err=True)
+    raise SystemExit(3)
+
+
+def test_run_command_captures_output():
+    assert run_command(group, "greet", {"name": "codantix"}) == {
+        "exit_code": 0,
+        "stdout": "hello codantix\n",
+        "stderr": "",
+    }
+    assert run_command(group, "fail", {}) == {"exit_code": 3, "stdout": "", "stderr": "boom\n"}
+    assert run_command(group, "missing", {})["exit_code"] == 2
+
+
+def test_forward_without_server(tmp_path):
+    assert forward("greet", {}, tmp_path / "codantix.sock") is None
+
+
+def test_forward_to_server(tmp_path):
+    socket_path = tmp_path / "codantix.sock"
+    server = make_server(group, socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        response = forward("greet", {}, socket_path)
+        assert response["exit_code"] == 0
+        assert response["stdout"] == "hello world\n"
+        with pytest.raises(RuntimeError):
+            make_server(group, socket_path)
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()